@@ -4,18 +4,246 @@ Simple CLI using Click directly (no Typer) to avoid version conflicts.
 
 import click
 import json
+import math
+import os
 import sys
 from pathlib import Path
 
-from etl.load_csvs import ingest_all
-from etl.validators import validate_all
-from app.services.query import get_finish_code_tree, get_all_finish_codes, get_finish_code_specs, get_all_specifications
+from app.services.db_pool import get_thread_conn
+
+try:
+    import orjson  # optional: pip install -e '.[fast-json]'
+except ImportError:
+    orjson = None
+
+# Service and ETL modules are imported inside the commands that use them, so
+# light commands (version, --help, queries) never pay for pandas at startup.
+
+# list-codes row layout: code, substrate, finish applied, description
+_CODE_ROW = "  {:10s}  {:12s}  {:12s}  {}\n".format
+
+# Colour is decided once per process; NO_COLOR (https://no-color.org) turns it off
+_USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+_style = click.style if _USE_COLOR else (lambda text, **styles: text)
+
+
+def _bold(text):
+    return f"\x1b[1m{text}\x1b[0m" if _USE_COLOR else text
+
+
+def _dim(text):
+    return f"\x1b[2m{text}\x1b[0m" if _USE_COLOR else text
+
+
+def _bold_cyan(text):
+    return f"\x1b[36m\x1b[1m{text}\x1b[0m" if _USE_COLOR else text
+
+
+# Fixed tree labels, styled once at import instead of on every step
+_DIRECT_SPECS = _style('Direct Specifications:', fg='green', bold=True)
+_FINISH_APPLIED_SPECS = _style('Finish Applied Specifications:', fg='green', bold=True)
+_PROCESS_STEPS = _style('Process Steps:', fg='yellow', bold=True)
+_SPECS_MULTI = _style('Specifications (any of):', fg='green')
+_SPECS_ONE = _style('Specification:', fg='green')
+_MATERIALS = _style('Materials:', fg='magenta')
+_NO_MATERIALS = _style('Materials: (not loaded yet)', dim=True)
+
+
+def _require_rich():
+    """Fail fast with an install hint when --rich is used without rich."""
+    try:
+        import rich  # noqa: F401
+    except ImportError:
+        raise click.UsageError("--rich requires the 'rich' package (pip install -e '.[rich]')")
+
+
+def _use_rich(requested):
+    """Honour --rich only for a terminal; piped and CI output stays plain text."""
+    return requested and sys.stdout.isatty()
+
+
+def _dumps_stdlib(obj, indent=None):
+    """
+    Serialize obj with json.dumps() to the bytes orjson writes.
+
+    UTF-8 without \\u escapes, with orjson's separators (compact when indent
+    is None). NaN and infinities become null, as in orjson, and a lone
+    surrogate, which UTF-8 can't encode, is written back as its \\uXXXX escape.
+    """
+    separators = (",", ": ") if indent else (",", ":")
+    options = dict(indent=indent or None, separators=separators, ensure_ascii=False)
+    try:
+        text = json.dumps(obj, allow_nan=False, **options)
+    except ValueError:
+        text = json.dumps(_nan_to_none(obj), **options)
+    return text.encode("utf-8", "backslashreplace")
+
+
+def _nan_to_none(obj):
+    """Return obj with every non-finite float replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(item) for item in obj]
+    return obj
+
+
+def _dumps(obj, indent=None):
+    """Serialize obj to JSON bytes via orjson when installed, else _dumps_stdlib()."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # Integers wider than 64 bits or lone surrogates, e.g. in hazard_flags
+    return _dumps_stdlib(obj, indent)
+
+
+def _write_json(obj, output=None, indent=2):
+    """Write obj as JSON to a file (or stdout plus a newline), via orjson when installed."""
+    data = _dumps(obj, indent)
+
+    if output:
+        with open(output, "wb") as f:
+            f.write(data)
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n")
+
+
+def _json_line(obj):
+    """Serialize obj as a single compact JSON line (no trailing newline), as orjson would."""
+    return _dumps(obj).decode("utf-8")
+
+
+def _write_ndjson(records, output=None):
+    """Write records one JSON object per line; return True if any was an error result."""
+    failed = False
+    out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    try:
+        for record in records:
+            failed = failed or "error" in record
+            out.write(_json_line(record) + "\n")
+    finally:
+        if output:
+            out.close()
+    return failed
+
+
+def _batch_codes(finish_code, batch):
+    """Return the codes to query: the argument, or stdin lines with --batch."""
+    if batch:
+        if finish_code:
+            raise click.UsageError(
+                "With --batch, pass finish codes on stdin instead of as an argument"
+            )
+        return [line.strip() for line in sys.stdin if line.strip()]
+    if not finish_code:
+        raise click.UsageError("Missing argument 'FINISH_CODE' (or use --batch)")
+    return [finish_code]
+
+
+def _map_codes(func, codes, jobs):
+    """
+    Yield func(code) for each code, in input order.
+
+    With jobs > 1 the lookups run on a thread pool. The query layer gives each
+    worker thread its own read-only connection, and WAL lets those readers
+    proceed concurrently.
+    """
+    if jobs <= 1:
+        yield from map(func, codes)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(func, codes)
+
+
+def _batch_options(command):
+    """Add the shared --batch/--jobs options to a per-finish-code command."""
+    command = click.option('--jobs', type=click.IntRange(min=1), default=1,
+                           help='Worker threads for --batch lookups')(command)
+    command = click.option('--batch', is_flag=True,
+                           help='Read finish codes from stdin, one per line')(command)
+    return command
+
+
+def _exit_on_broken_pipe():
+    """Exit quietly when a downstream reader (e.g. `head`) closes stdout early."""
+    # Point stdout at devnull so the interpreter's final flush doesn't raise again
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    sys.exit(1)
+
+
+def _render_tree(result):
+    """Yield the lines of a finish code tree (without trailing newlines)."""
+    parsed = result['parsed']
+    yield f"\n{_bold_cyan(result['finish_code'])}: {parsed['finish_description']}"
+    yield f"├─ Program: {parsed['program']}"
+    yield f"├─ Source Doc: {parsed['source_doc']}"
+    substrate, finish_applied = parsed['substrate'], parsed['finish_applied']
+    yield f"├─ Substrate: {substrate['code']} - {substrate['description'][:60]}"
+    yield f"├─ Finish Applied: {finish_applied['code']} - {finish_applied['description'][:60]}"
+    yield f"└─ Sequence ID: {parsed['seq_id']}"
+
+    # Display direct specifications if present (bypasses SFT steps)
+    if result.get('direct_specs'):
+        yield f"\n{_DIRECT_SPECS}"
+        for spec in result['direct_specs']:
+            yield f"  • {spec}"
+
+    if result.get('finish_applied_specs'):
+        yield f"\n{_FINISH_APPLIED_SPECS}"
+        for spec in result['finish_applied_specs']:
+            yield f"  • {spec}"
+
+    # Display SFT steps (may be empty for some programs)
+    if result['steps']:
+        yield f"\n{_PROCESS_STEPS}"
+
+        for i, step in enumerate(result['steps']):
+            is_last_step = (i == len(result['steps']) - 1)
+            step_prefix = "└─" if is_last_step else "├─"
+            indent = "   " if is_last_step else "│  "
+
+            step_title = f'Step {step["step_order"]}: {step["sft_code"]}'
+            yield f"\n{step_prefix} {_bold(step_title)}"
+            yield f"{indent} Group: {step['parent_group'] or 'N/A'}"
+            yield f"{indent} Description: {step['description'][:70]}"
+
+            specs = step['associated_specs_list']
+            if specs:
+                yield f"{indent} {_SPECS_MULTI if len(specs) > 1 else _SPECS_ONE}"
+                for spec in specs:
+                    yield f"{indent}   • {spec}"
+
+            if step['materials']:
+                yield f"{indent} {_MATERIALS}"
+                for mat in step['materials']:
+                    mat_variant = (' ' + mat['variant']) if mat['variant'] else ''
+                    yield f"{indent}   • {mat['base_spec']}{mat_variant}"
+
+                    if mat['chemicals']:
+                        for chem in mat['chemicals']:
+                            level = chem['default_hazard_level']
+                            hazard = f" [Hazard Level {level}]" if level else ""
+                            yield f"{indent}     - {chem['name']}{hazard}"
+            else:
+                yield f"{indent} {_NO_MATERIALS}"
+
+    yield ""
 
 
 @click.group()
 def cli():
     """Hazardous Finishes Data Engine CLI"""
-    pass
+    # Piped output: block-buffer stdout and let the large writes go out in few syscalls
+    if not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 
 @cli.command()
@@ -23,12 +251,18 @@ def cli():
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
 @click.option('--schema', default='db/schema.sql', help='Path to schema.sql file')
 @click.option('--output', default=None, help='Path to write JSON ingestion report')
-def ingest(input_dir, db, schema, output):
+@click.option('--rich', 'use_rich', is_flag=True,
+              help='Render loaded files as a Rich table on a terminal (requires rich)')
+def ingest(input_dir, db, schema, output, use_rich):
     """Ingest CSV files into SQLite database."""
+    if use_rich:
+        _require_rich()
     click.echo(f"\nIngesting CSV files from: {input_dir}")
     click.echo(f"Target database: {db}\n")
 
     try:
+        from etl.load_csvs import ingest_all
+
         report = ingest_all(input_dir, db, schema)
 
         if output is None:
@@ -43,10 +277,28 @@ def ingest(input_dir, db, schema, output):
         click.echo(f"Status: {report['status']}")
         click.echo(f"Files loaded: {len(report['loaded_files'])}")
 
-        if report['loaded_files']:
-            click.echo("\nLoaded files:")
-            for filename, info in report['loaded_files'].items():
-                click.echo(f"  {filename}: {info['rows']} rows (SHA256: {info['sha256'][:16]}...)")
+        loaded_files = report['loaded_files']
+        if loaded_files and _use_rich(use_rich):
+            from rich.console import Console
+            from rich.table import Table
+
+            table = Table(title="Loaded Files")
+            table.add_column("File", style="cyan")
+            table.add_column("Rows", justify="right", style="magenta")
+            table.add_column("SHA256", style="dim")
+            rows = [
+                (name, str(info['rows']), info['sha256'][:16] + "...")
+                for name, info in loaded_files.items()
+            ]
+            for row in rows:
+                table.add_row(*row)
+            Console().print(table)
+        elif loaded_files:
+            summary = "\n".join(
+                f"  {name}: {info['rows']} rows (SHA256: {info['sha256'][:16]}...)"
+                for name, info in loaded_files.items()
+            )
+            click.echo(f"\nLoaded files:\n{summary}")
 
         val_report = report['validation_report']
         if val_report['status'] == 'pass':
@@ -73,10 +325,9 @@ def validate(db):
     click.echo(f"\nValidating database: {db}\n")
 
     try:
-        import sqlite3
-        conn = sqlite3.connect(db)
-        report = validate_all(conn)
-        conn.close()
+        from etl.validators import validate_all
+
+        report = validate_all(get_thread_conn(db))
 
         click.echo(f"Status: {report['status']}")
         click.echo(f"Errors: {report['error_count']}")
@@ -106,47 +357,68 @@ def validate(db):
 
 
 @cli.command()
-@click.argument('finish_code')
+@click.argument('finish_code', required=False)
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
 @click.option('--output', default=None, help='Write output to JSON file')
 @click.option('--compact', is_flag=True, help='Compact JSON output')
-def show(finish_code, db, output, compact):
-    """Display full finish code hierarchy as JSON."""
+@_batch_options
+def show(finish_code, db, output, compact, batch, jobs):
+    """Display full finish code hierarchy as JSON (NDJSON with --batch)."""
+    codes = _batch_codes(finish_code, batch)
     try:
-        result = get_finish_code_tree(finish_code, db)
+        from app.services.cache import get_cached_tree
 
-        indent = None if compact else 2
-        json_str = json.dumps(result, indent=indent)
+        if batch:
+            results = _map_codes(lambda code: get_cached_tree(code, db), codes, jobs)
+            failed = _write_ndjson(results, output)
+            if output:
+                click.secho(f"✓ NDJSON written to: {output}", fg='green')
+            if failed:
+                sys.exit(1)
+            return
+
+        result = get_cached_tree(finish_code, db)
 
+        _write_json(result, output, indent=None if compact else 2)
         if output:
-            with open(output, "w") as f:
-                f.write(json_str)
             click.secho(f"✓ Output written to: {output}", fg='green')
-        else:
-            click.echo(json_str)
 
         if "error" in result:
             sys.exit(1)
 
+    except BrokenPipeError:
+        _exit_on_broken_pipe()
     except Exception as e:
         click.secho(f"Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
 @cli.command()
-@click.argument('finish_code')
+@click.argument('finish_code', required=False)
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
 @click.option('--output', default=None, help='Write output to JSON file')
 @click.option('--compact', is_flag=True, help='Compact JSON output')
-def specs(finish_code, db, output, compact):
-    """List all unique specifications for a finish code."""
+@_batch_options
+def specs(finish_code, db, output, compact, batch, jobs):
+    """List all unique specifications for a finish code (NDJSON with --batch)."""
+    codes = _batch_codes(finish_code, batch)
     try:
+        from app.services.cache import get_cached_tree
+        from app.services.query import get_finish_code_specs
+
+        if batch:
+            results = _map_codes(lambda code: get_finish_code_specs(code, db), codes, jobs)
+            failed = _write_ndjson(results, output)
+            if output:
+                click.secho(f"✓ NDJSON written to: {output}", fg='green')
+            if failed:
+                sys.exit(1)
+            return
+
         result = get_finish_code_specs(finish_code, db)
 
         if output:
-            indent = None if compact else 2
-            with open(output, "w") as f:
-                json.dump(result, f, indent=indent)
+            _write_json(result, output, indent=None if compact else 2)
             click.secho(f"✓ Output written to: {output}", fg='green')
             return
 
@@ -159,11 +431,10 @@ def specs(finish_code, db, output, compact):
             sys.exit(1)
 
         # Get the full finish code info to display program and source_doc
-        from app.services.query import get_finish_code_tree
-        tree_result = get_finish_code_tree(finish_code, db)
+        tree_result = get_cached_tree(finish_code, db)
 
         # Display results in human-readable format
-        click.echo(f"\nSpecifications for finish code: {click.style(result['finish_code'], bold=True)}")
+        click.echo(f"\nSpecifications for finish code: {_bold(result['finish_code'])}")
         if 'parsed' in tree_result:
             parsed = tree_result['parsed']
             click.echo(f"Program: {parsed['program']}")
@@ -171,28 +442,35 @@ def specs(finish_code, db, output, compact):
         click.echo(f"Total unique specifications: {result['spec_count']}\n")
 
         if result['specifications']:
-            click.secho("Unique Specifications:", fg='cyan', bold=True)
-            for spec in result['specifications']:
-                click.echo(f"  • {spec}")
-
-            if result['steps_with_specs']:
-                click.echo(f"\n{click.style('Used in SFT Steps:', fg='cyan', bold=True)}")
-                for step in result['steps_with_specs']:
+            # Whole listing is built first and written with a single echo
+            lines = [_bold_cyan("Unique Specifications:")]
+            lines.extend(f"  • {spec}" for spec in result['specifications'])
+
+            steps_with_specs = result['steps_with_specs']
+            if steps_with_specs:
+                lines.append(f"\n{_bold_cyan('Used in SFT Steps:')}")
+                # Pad SFT codes to the longest one present, computed once
+                width = max(len(step['sft_code']) for step in steps_with_specs)
+                padded_codes = [step['sft_code'].ljust(width) for step in steps_with_specs]
+                for step, sft_code in zip(steps_with_specs, padded_codes):
                     # Check if this step has multiple alternative specs
                     spec_list = step.get('associated_specs_list', [])
                     if len(spec_list) > 1:
                         # Multiple specs = alternatives (OR relationship)
-                        click.echo(f"  [{step['step_order']}] {step['sft_code']:15s} → Any of:")
-                        for spec in spec_list:
-                            click.echo(f"      • {spec}")
+                        lines.append(f"  [{step['step_order']}] {sft_code} → Any of:")
+                        lines.extend(f"      • {spec}" for spec in spec_list)
                     else:
                         # Single spec
-                        click.echo(f"  [{step['step_order']}] {step['sft_code']:15s} → {step['associated_specs']}")
-                    click.echo(f"      {click.style(step['description'], dim=True)}")
+                        lines.append(
+                            f"  [{step['step_order']}] {sft_code} → {step['associated_specs']}"
+                        )
+                    lines.append(f"      {_dim(step['description'])}")
+
+            lines.append("")
+            click.echo("\n".join(lines))
         else:
             click.secho("No specifications found for this finish code.", fg='yellow')
-
-        click.echo()
+            click.echo()
 
     except Exception as e:
         click.secho(f"Error: {e}", fg='red', err=True)
@@ -201,69 +479,80 @@ def specs(finish_code, db, output, compact):
 
 @cli.command()
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
-@click.option('--format', 'output_format', type=click.Choice(['table', 'csv', 'json'], case_sensitive=False),
-              default='table', help='Output format')
+@click.option('--format', 'output_format',
+              type=click.Choice(['table', 'csv', 'json', 'ndjson'], case_sensitive=False),
+              default='table', help='Output format (ndjson: one JSON object per specification)')
 @click.option('--output', default=None, help='Write output to file')
 def list_specs(db, output_format, output):
     """List all unique specifications across all finish codes."""
     try:
-        result = get_all_specifications(db)
+        from app.services.query import get_all_specifications, iter_all_specifications
 
         if output_format == 'json':
-            # JSON output
-            json_str = json.dumps(result, indent=2)
+            # JSON output - needs the full list for total_specs
+            result = get_all_specifications(db)
+            _write_json(result, output)
             if output:
-                with open(output, 'w') as f:
-                    f.write(json_str)
                 click.secho(f"✓ JSON written to: {output}", fg='green')
-            else:
-                click.echo(json_str)
+
+        elif output_format == 'ndjson':
+            # JSON Lines output - one specification per line for jq/pipe consumers
+            _write_ndjson(iter_all_specifications(db), output)
+            if output:
+                click.secho(f"✓ NDJSON written to: {output}", fg='green')
 
         elif output_format == 'csv':
-            # CSV output - ready for materials mapping
+            # CSV output - ready for materials mapping, written row by row
             import csv
-            import io
-
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
 
-            # Header
-            writer.writerow(['specification', 'usage_count', 'sft_codes', 'finish_codes'])
-
-            # Data rows
-            for spec_data in result['specifications']:
-                writer.writerow([
-                    spec_data['spec'],
-                    spec_data['usage_count'],
-                    ';'.join(spec_data['sft_codes']),
-                    ';'.join(spec_data['finish_codes'][:5]) + ('...' if len(spec_data['finish_codes']) > 5 else '')
-                ])
-
-            csv_output = csv_buffer.getvalue()
+            out = open(output, 'w', newline='') if output else sys.stdout
+            try:
+                writer = csv.writer(out)
+
+                # Header
+                writer.writerow(['specification', 'usage_count', 'sft_codes', 'finish_codes'])
+
+                # Data rows
+                for spec_data in iter_all_specifications(db):
+                    writer.writerow([
+                        spec_data['spec'],
+                        spec_data['usage_count'],
+                        ';'.join(spec_data['sft_codes']),
+                        ';'.join(spec_data['finish_codes'][:5])
+                        + ('...' if len(spec_data['finish_codes']) > 5 else '')
+                    ])
+            finally:
+                if output:
+                    out.close()
 
             if output:
-                with open(output, 'w') as f:
-                    f.write(csv_output)
                 click.secho(f"✓ CSV written to: {output}", fg='green')
-            else:
-                click.echo(csv_output)
 
         else:
-            # Table output (default)
-            click.echo(f"\n{click.style('All Specifications', fg='cyan', bold=True)}")
-            click.echo(f"Total unique specifications: {result['total_specs']}\n")
-
-            if result['specifications']:
-                for spec_data in result['specifications']:
-                    click.echo(f"{click.style(spec_data['spec'], bold=True)}")
-                    click.echo(f"  Used in: {spec_data['usage_count']} finish codes")
-                    click.echo(f"  SFT steps: {', '.join(spec_data['sft_codes'][:5])}")
-                    if len(spec_data['sft_codes']) > 5:
-                        click.echo(f"             ... and {len(spec_data['sft_codes']) - 5} more")
-                    click.echo()
+            # Table output (default) - total printed as a footer once all rows are out
+            click.echo(f"\n{_bold_cyan('All Specifications')}\n")
+
+            total_specs = 0
+            for spec_data in iter_all_specifications(db):
+                total_specs += 1
+                block = [
+                    _bold(spec_data['spec']),
+                    f"  Used in: {spec_data['usage_count']} finish codes",
+                    f"  SFT steps: {', '.join(spec_data['sft_codes'][:5])}",
+                ]
+                if len(spec_data['sft_codes']) > 5:
+                    block.append(f"             ... and {len(spec_data['sft_codes']) - 5} more")
+                block.append("")
+                # One write per specification instead of one per line
+                click.echo("\n".join(block))
+
+            if total_specs:
+                click.echo(f"Total unique specifications: {total_specs}\n")
             else:
                 click.secho("No specifications found in database.", fg='yellow')
 
+    except BrokenPipeError:
+        _exit_on_broken_pipe()
     except Exception as e:
         click.secho(f"Error: {e}", fg='red', err=True)
         import traceback
@@ -273,22 +562,50 @@ def list_specs(db, output_format, output):
 
 @cli.command()
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
-def list_codes(db):
+@click.option('--rich', 'use_rich', is_flag=True,
+              help='Render codes as a Rich table on a terminal (requires rich)')
+def list_codes(db, use_rich):
     """List all finish codes in database."""
+    if use_rich:
+        _require_rich()
     click.echo(f"\nFinish codes in database: {db}\n")
 
     try:
-        codes = get_all_finish_codes(db)
+        from app.services.cache import get_cached_finish_codes
+
+        codes = get_cached_finish_codes(db)
 
         if not codes:
             click.secho("No finish codes found in database", fg='yellow')
             click.echo("Run 'hazard-cli ingest' to load data\n")
             return
 
-        click.echo(f"Found {len(codes)} finish codes:\n")
-        for code in codes:
-            click.echo(f"  {code['code']:10s}  {code['substrate']:12s}  {code['finish_applied']:12s}  {code['description'] or ''}")
-        click.echo()
+        if _use_rich(use_rich):
+            from rich.console import Console
+            from rich.table import Table
+
+            table = Table(title=f"Finish Codes ({len(codes)} total)")
+            table.add_column("Code", style="cyan", no_wrap=True)
+            table.add_column("Substrate", style="green")
+            table.add_column("Finish", style="magenta")
+            table.add_column("Seq", justify="right", style="yellow")
+            table.add_column("Description", style="dim")
+            for code in codes:
+                table.add_row(
+                    code['code'],
+                    code['substrate'],
+                    code['finish_applied'],
+                    str(code['seq_id']),
+                    code['description'] or ""
+                )
+            Console().print(table)
+            return
+
+        rows = "".join(
+            _CODE_ROW(c['code'], c['substrate'], c['finish_applied'], c['description'] or '')
+            for c in codes
+        )
+        click.echo(f"Found {len(codes)} finish codes:\n\n{rows}")
 
     except Exception as e:
         click.secho(f"Error: {e}", fg='red', err=True)
@@ -296,12 +613,32 @@ def list_codes(db):
 
 
 @cli.command()
-@click.argument('finish_code')
+@click.argument('finish_code', required=False)
 @click.option('--db', default='data/hazardous_finishes.sqlite', help='Path to SQLite database')
-def tree(finish_code, db):
+@click.option('--pager/--no-pager', default=False,
+              help='Page the tree through $PAGER (single code)')
+@_batch_options
+def tree(finish_code, db, pager, batch, jobs):
     """Display finish code hierarchy as readable tree."""
+    codes = _batch_codes(finish_code, batch)
     try:
-        result = get_finish_code_tree(finish_code, db)
+        from app.services.cache import get_cached_tree
+
+        if batch:
+            # One tree after another; unknown codes are reported on stderr
+            failed = False
+            for result in _map_codes(lambda code: get_cached_tree(code, db), codes, jobs):
+                if "error" in result:
+                    failed = True
+                    click.secho(f"Error: {result['error']}: {result['finish_code']}",
+                                fg='red', err=True)
+                else:
+                    click.echo("\n".join(_render_tree(result)))
+            if failed:
+                sys.exit(1)
+            return
+
+        result = get_cached_tree(finish_code, db)
 
         if "error" in result:
             click.secho(f"Error: {result['error']}", fg='red')
@@ -311,67 +648,14 @@ def tree(finish_code, db):
                     click.echo(f"  {code}")
             sys.exit(1)
 
-        # Display tree
-        parsed = result['parsed']
-        click.echo(f"\n{click.style(result['finish_code'], fg='cyan', bold=True)}: {parsed['finish_description']}")
-        click.echo(f"├─ Program: {parsed['program']}")
-        click.echo(f"├─ Source Doc: {parsed['source_doc']}")
-        click.echo(f"├─ Substrate: {parsed['substrate']['code']} - {parsed['substrate']['description'][:60]}")
-        click.echo(f"├─ Finish Applied: {parsed['finish_applied']['code']} - {parsed['finish_applied']['description'][:60]}")
-        click.echo(f"└─ Sequence ID: {parsed['seq_id']}")
-
-        # Display direct specifications if present (bypasses SFT steps)
-        if result.get('direct_specs'):
-            click.echo(f"\n{click.style('Direct Specifications:', fg='green', bold=True)}")
-            for spec in result['direct_specs']:
-                click.echo(f"  • {spec}")
-
-        if result.get('finish_applied_specs'):
-            click.echo(f"\n{click.style('Finish Applied Specifications:', fg='green', bold=True)}")
-            for spec in result['finish_applied_specs']:
-                click.echo(f"  • {spec}")
-
-        # Display SFT steps (may be empty for some programs)
-        if result['steps']:
-            click.echo(f"\n{click.style('Process Steps:', fg='yellow', bold=True)}")
-
-            for i, step in enumerate(result['steps']):
-                is_last_step = (i == len(result['steps']) - 1)
-                step_prefix = "└─" if is_last_step else "├─"
-                indent = "   " if is_last_step else "│  "
-
-                step_title = f'Step {step["step_order"]}: {step["sft_code"]}'
-                click.echo(f"\n{step_prefix} {click.style(step_title, bold=True)}")
-                click.echo(f"{indent} Group: {step['parent_group'] or 'N/A'}")
-                click.echo(f"{indent} Description: {step['description'][:70]}")
-
-                if step['associated_specs']:
-                    specs = [s.strip() for s in step['associated_specs'].split(',')]
-                    if len(specs) > 1:
-                        specs_title = click.style('Specifications (any of):', fg='green')
-                    else:
-                        specs_title = click.style('Specification:', fg='green')
-                    click.echo(f"{indent} {specs_title}")
-                    for spec in specs:
-                        click.echo(f"{indent}   • {spec}")
-
-                if step['materials']:
-                    materials_title = click.style('Materials:', fg='magenta')
-                    click.echo(f"{indent} {materials_title}")
-                    for mat in step['materials']:
-                        mat_variant = (' ' + mat['variant']) if mat['variant'] else ''
-                        click.echo(f"{indent}   • {mat['base_spec']}{mat_variant}")
-
-                        if mat['chemicals']:
-                            for chem in mat['chemicals']:
-                                hazard = f" [Hazard Level {chem['default_hazard_level']}]" if chem['default_hazard_level'] else ""
-                                click.echo(f"{indent}     - {chem['name']}{hazard}")
-                else:
-                    no_materials_msg = click.style('Materials: (not loaded yet)', dim=True)
-                    click.echo(f"{indent} {no_materials_msg}")
-
-        click.echo()
+        lines = _render_tree(result)
+        if pager:
+            click.echo_via_pager(f"{line}\n" for line in lines)
+        else:
+            click.echo("\n".join(lines))
 
+    except BrokenPipeError:
+        _exit_on_broken_pipe()
     except Exception as e:
         click.secho(f"Error: {e}", fg='red', err=True)
         import traceback
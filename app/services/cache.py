@@ -0,0 +1,129 @@
+"""
+On-disk memoization of finish code query results.
+
+The database only changes on ingest, so query results are cached as JSON
+files keyed by the database file's identity (path, size, mtime). Results
+are written through on a miss; any ingest changes the key and old entries
+are simply never read again.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import quote
+
+from app.services.query import (
+    db_version,
+    get_all_finish_codes,
+    get_finish_code_tree,
+    json_dumps,
+    json_loads,
+)
+
+# Bump when the shape of cached results changes
+CACHE_VERSION = 2
+
+
+def get_cache_dir() -> Path:
+    """Return the cache root (override with HAZARD_CACHE_DIR)."""
+    override = os.environ.get("HAZARD_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "hazardous_finishes"
+
+
+def _db_cache_key(db_path: str) -> str:
+    """
+    Build a cache key that changes whenever the database contents change.
+
+    Raises:
+        FileNotFoundError: If database file not found
+    """
+    parts = [str(CACHE_VERSION), *map(str, db_version(db_path))]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+
+def _read(path: Path) -> Optional[Any]:
+    try:
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path: Path, value: Any) -> None:
+    # orjson refuses integers wider than 64 bits and lone surrogates, which
+    # stdlib-parsed hazard_flags may hold; such results are left uncached
+    try:
+        text = json_dumps(value)
+    except TypeError:
+        return
+
+    # Cache is best-effort: an unwritable cache dir must never fail a query
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # pid + thread id: batch lookups may write the same entry concurrently
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_cached_tree(
+    finish_code: str,
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> dict[str, Any]:
+    """
+    Return get_finish_code_tree() for a finish code, served from disk when possible.
+
+    Args:
+        finish_code: Finish code to query (e.g., "BP27")
+        db_path: Path to SQLite database
+        conn: Open connection used on a cache miss (left open)
+
+    Returns:
+        Same structure as get_finish_code_tree()
+
+    Raises:
+        FileNotFoundError: If database file not found
+    """
+    tree_dir = get_cache_dir() / _db_cache_key(db_path) / "trees"
+    cache_file = tree_dir / f"{quote(finish_code, safe='')}.json"
+
+    result = _read(cache_file)
+    if result is None:
+        result = get_finish_code_tree(finish_code, db_path, conn=conn)
+        _write(cache_file, result)
+    return result
+
+
+def get_cached_finish_codes(
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> list[dict[str, Any]]:
+    """
+    Return get_all_finish_codes(), served from disk when possible.
+
+    Each call returns a fresh list. The in-process memo is the one
+    get_all_finish_codes() already keeps, which hands out copies.
+
+    Args:
+        db_path: Path to SQLite database
+        conn: Open connection used on a cache miss (left open)
+
+    Returns:
+        Same structure as get_all_finish_codes()
+
+    Raises:
+        FileNotFoundError: If database file not found
+    """
+    cache_file = get_cache_dir() / _db_cache_key(db_path) / "codes.json"
+    codes = _read(cache_file)
+    if codes is None:
+        codes = get_all_finish_codes(db_path, conn=conn)
+        _write(cache_file, codes)
+    return codes
@@ -0,0 +1,104 @@
+"""
+Shared SQLite connection pool for CLI and service layer.
+
+Opening a connection re-reads the schema and starts with a cold page cache,
+so each thread keeps one read-only connection per database file and reuses
+it for every query and command. A thread's connections are closed when the
+thread exits; those of threads still running are closed at interpreter exit.
+Writes (ingest) open their own connection in etl.load_csvs.
+"""
+
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+# Connection tuning applied once when a pooled connection is opened. The
+# page cache (128 MiB) is a ceiling that fills on demand, and mmap (1 GiB)
+# only maps as much of the file as exists, so small databases pay nothing.
+READ_PRAGMAS = """
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -131072;
+    PRAGMA mmap_size = 1073741824;
+"""
+
+
+def _close_conns(conns: dict[tuple[str, int], sqlite3.Connection]) -> None:
+    while conns:
+        _, conn = conns.popitem()
+        conn.close()
+
+
+class _ThreadConnections:
+    """One thread's pooled connections, keyed by (resolved path, inode)."""
+
+    def __init__(self):
+        self.conns: dict[tuple[str, int], sqlite3.Connection] = {}
+        # Runs when the thread exits and its thread-local state is freed, or
+        # at interpreter exit for threads still running
+        weakref.finalize(self, _close_conns, self.conns)
+
+
+class _PoolLocal(threading.local):
+    def __init__(self):
+        self.pool = _ThreadConnections()
+
+
+_LOCAL = _PoolLocal()
+
+
+def connect_readonly(db_path: str) -> sqlite3.Connection:
+    """
+    Open a new, unpooled read-only connection.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        SQLite connection opened with mode=ro; the caller closes it
+
+    Raises:
+        FileNotFoundError: If database file not found
+        sqlite3.Error: If connection setup fails
+    """
+    db_file = Path(db_path)
+    if not db_file.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    uri = f"{db_file.resolve().as_uri()}?mode=ro"
+    # Closed by the pool's finalizer, which may run on another thread at exit
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.executescript(READ_PRAGMAS)
+    return conn
+
+
+def get_thread_conn(db_path: str) -> sqlite3.Connection:
+    """
+    Return the calling thread's pooled read-only connection for a database file.
+
+    The connection is opened with mode=ro on first use, so it never takes
+    write locks or changes journal settings. Connections are keyed by path
+    and inode, so a database file that is replaced on disk gets a fresh
+    connection instead of a stale handle.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        Read-only SQLite connection owned by the current thread (left open)
+
+    Raises:
+        FileNotFoundError: If database file not found
+        sqlite3.Error: If connection setup fails
+    """
+    db_file = Path(db_path)
+    if not db_file.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    key = (str(db_file.resolve()), db_file.stat().st_ino)
+    conns = _LOCAL.pool.conns
+    conn = conns.get(key)
+    if conn is None:
+        conn = connect_readonly(db_path)
+        conns[key] = conn
+    return conn
@@ -7,20 +7,185 @@ Provides functions to:
 - Return structured JSON for CLI and GUI consumption
 """
 
+import copy
+import inspect
 import json
 import sqlite3
-from datetime import datetime
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+from app.services.db_pool import get_thread_conn
 
-def get_finish_code_tree(finish_code: str, db_path: str = "data/hazardous_finishes.sqlite") -> dict[str, Any]:
+try:
+    import orjson  # optional: pip install -e '.[fast-json]'
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to compact JSON text (orjson when installed)."""
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to compact JSON text (orjson when installed)."""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+@contextmanager
+def _connection(
+    db_path: str, conn: Optional[sqlite3.Connection] = None
+) -> Iterator[sqlite3.Connection]:
+    """
+    Yield a connection for a query: the supplied one, else this thread's pooled one.
+
+    Queries only read, so without an explicit connection they share the
+    thread's read-only connection from db_pool instead of opening and
+    closing one per call. Neither kind is closed here.
+
+    Args:
+        db_path: Path to SQLite database
+        conn: Existing connection to reuse (left open for the caller)
+
+    Raises:
+        FileNotFoundError: If no connection supplied and database file not found
+    """
+    if conn is None:
+        conn = get_thread_conn(db_path)
+    yield conn
+
+
+def db_version(db_path: str) -> tuple:
+    """
+    Identify the current contents of a database file for caching.
+
+    Shared by the in-process memo here and the on-disk cache in
+    app.services.cache: (resolved path, size, mtime_ns), plus the WAL size
+    while un-checkpointed writes are pending. The WAL's mtime is left out,
+    and so is an empty WAL, since opening a read-only connection creates
+    or touches the file without writing anything.
+
+    Raises:
+        FileNotFoundError: If database file not found
+    """
+    db_file = Path(db_path)
+    if not db_file.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+
+    st = db_file.stat()
+    version = (str(db_file.resolve()), st.st_size, st.st_mtime_ns)
+
+    # Committed-but-uncheckpointed writes only touch the WAL file
+    wal_file = Path(f"{db_file}-wal")
+    if wal_file.exists():
+        wal_size = wal_file.stat().st_size
+        if wal_size:
+            version += (wal_size,)
+    return version
+
+
+def _memoize_per_db_version(func):
+    """
+    Cache a query function's results in-process until the database changes.
+
+    Results are keyed by the call's arguments plus db_version(db_path), so an
+    ingest invalidates them without an explicit cache_clear(). Calls that pass
+    their own connection bypass the cache, since it may see uncommitted data.
+    Callers get a deep copy and are free to mutate it.
+    """
+    signature = inspect.signature(func)
+
+    @lru_cache(maxsize=256)
+    def cached(version: tuple, arguments: tuple) -> Any:
+        return func(*arguments)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if bound.arguments.get("conn") is not None:
+            return func(*args, **kwargs)
+
+        arguments = tuple(value for name, value in bound.arguments.items() if name != "conn")
+        version = db_version(bound.arguments["db_path"])
+        return copy.deepcopy(cached(version, arguments))
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@lru_cache(maxsize=4096)
+def _loads_hazard_flags(raw: str) -> Any:
+    """
+    json.loads() for chemicals.hazard_flags, cached per distinct value.
+
+    The same chemical recurs across materials and trees, so each flag string
+    is parsed once per process. Parsed values are shared between results and
+    must not be mutated; invalid JSON raises every time (nothing is cached).
+    Always the stdlib parser, the one ingest and validation check flags with:
+    orjson rejects or reads differently some JSON they accept (NaN, 1e400,
+    integers wider than 64 bits, lone surrogate escapes).
+    """
+    return json.loads(raw)
+
+
+def _execute_on_sft_specs(cursor: sqlite3.Cursor, sql: str, params: tuple = ()) -> None:
+    """
+    Run a query that reads sft_specs, explaining a missing table.
+
+    Databases ingested before schema 1.1.0 have no sft_specs table until
+    they are ingested again.
+
+    Raises:
+        sqlite3.OperationalError: If the query fails (with a re-ingest hint
+            when sft_specs is missing)
+    """
+    try:
+        cursor.execute(sql, params)
+    except sqlite3.OperationalError as e:
+        if "no such table: sft_specs" not in str(e):
+            raise
+        raise sqlite3.OperationalError(
+            "no such table: sft_specs (the database predates it; re-run "
+            "'hazard-cli ingest' to create it)"
+        ) from e
+
+
+def _utc_now_iso() -> str:
+    """Return the current time as ingest stamps loaded_at (UTC, e.g. 2026-01-31T09:15:02.418Z)."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _split_specs(specs_raw: Optional[str]) -> list[str]:
+    """Split a comma-separated associated_specs value into individual specs."""
+    if not specs_raw:
+        return []
+    return [s.strip() for s in specs_raw.split(',') if s.strip()]
+
+
+@_memoize_per_db_version
+def get_finish_code_tree(
+    finish_code: str,
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> dict[str, Any]:
     """
     Retrieve complete finish code hierarchy with all related data.
 
     Args:
         finish_code: Finish code to query (e.g., "BP27")
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
 
     Returns:
         Dictionary with structure:
@@ -39,6 +204,7 @@ def get_finish_code_tree(finish_code: str, db_path: str = "data/hazardous_finish
                     "parent_group": str | null,
                     "description": str,
                     "associated_specs": str | null,
+                    "associated_specs_list": [str],
                     "source_doc": str | null,
                     "last_review": str | null,
                     "notes": str | null,
@@ -63,7 +229,7 @@ def get_finish_code_tree(finish_code: str, db_path: str = "data/hazardous_finish
             ],
             "provenance": {
                 "csv_shas": {filename: sha256, ...},
-                "loaded_at": str (ISO datetime of most recent load)
+                "loaded_at": str (ISO 8601 UTC time of most recent load)
             }
         }
 
@@ -78,196 +244,186 @@ def get_finish_code_tree(finish_code: str, db_path: str = "data/hazardous_finish
         FileNotFoundError: If database file not found
         sqlite3.Error: If database query fails
     """
-    db_file = Path(db_path)
-    if not db_file.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    cursor = conn.cursor()
+    with _connection(db_path, conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row  # Enable column access by name
+
+        # Check if finish code exists
+        cursor.execute("SELECT * FROM finish_codes WHERE code = ?", (finish_code,))
+        fc_row = cursor.fetchone()
+
+        if not fc_row:
+            # Return error with available codes
+            cursor.execute("SELECT code FROM finish_codes ORDER BY code LIMIT 10")
+            available = [row[0] for row in cursor.fetchall()]
+            return {
+                "error": "Finish code not found",
+                "finish_code": finish_code,
+                "available_codes": available
+            }
 
-    # Check if finish code exists
-    cursor.execute("SELECT * FROM finish_codes WHERE code = ?", (finish_code,))
-    fc_row = cursor.fetchone()
+        # Later queries bind the primary key instead of re-resolving the code
+        finish_code_id = fc_row["id"]
 
-    if not fc_row:
-        # Return error with available codes
-        cursor.execute("SELECT code FROM finish_codes ORDER BY code LIMIT 10")
-        available = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return {
-            "error": "Finish code not found",
-            "finish_code": finish_code,
-            "available_codes": available
+        # Get parsed components
+        cursor.execute("""
+            SELECT
+                fc.code,
+                fc.seq_id,
+                fc.description AS finish_description,
+                fc.notes,
+                fc.source_doc,
+                fc.program,
+                fc.associated_specs,
+                s.code AS substrate_code,
+                s.description AS substrate_description,
+                fa.code AS finish_applied_code,
+                fa.description AS finish_applied_description,
+                fa.associated_specs AS finish_applied_specs
+            FROM finish_codes fc
+            JOIN substrates s ON fc.substrate_id = s.id
+            JOIN finish_applied fa ON fc.finish_applied_id = fa.id
+            WHERE fc.id = ?
+        """, (finish_code_id,))
+        parsed_row = cursor.fetchone()
+
+        parsed = {
+            "substrate": {
+                "code": parsed_row["substrate_code"],
+                "description": parsed_row["substrate_description"]
+            },
+            "finish_applied": {
+                "code": parsed_row["finish_applied_code"],
+                "description": parsed_row["finish_applied_description"]
+            },
+            "seq_id": parsed_row["seq_id"],
+            "finish_description": parsed_row["finish_description"],
+            "notes": parsed_row["notes"],
+            "source_doc": parsed_row["source_doc"],
+            "program": parsed_row["program"],
+            "associated_specs": parsed_row["associated_specs"]
         }
 
-    # Get parsed components
-    cursor.execute("""
-        SELECT
-            fc.code,
-            fc.seq_id,
-            fc.description AS finish_description,
-            fc.notes,
-            fc.source_doc,
-            fc.program,
-            fc.associated_specs,
-            s.code AS substrate_code,
-            s.description AS substrate_description,
-            fa.code AS finish_applied_code,
-            fa.description AS finish_applied_description,
-            fa.associated_specs AS finish_applied_specs
-        FROM finish_codes fc
-        JOIN substrates s ON fc.substrate_id = s.id
-        JOIN finish_applied fa ON fc.finish_applied_id = fa.id
-        WHERE fc.code = ?
-    """, (finish_code,))
-    parsed_row = cursor.fetchone()
-
-    parsed = {
-        "substrate": {
-            "code": parsed_row["substrate_code"],
-            "description": parsed_row["substrate_description"]
-        },
-        "finish_applied": {
-            "code": parsed_row["finish_applied_code"],
-            "description": parsed_row["finish_applied_description"]
-        },
-        "seq_id": parsed_row["seq_id"],
-        "finish_description": parsed_row["finish_description"],
-        "notes": parsed_row["notes"],
-        "source_doc": parsed_row["source_doc"],
-        "program": parsed_row["program"],
-        "associated_specs": parsed_row["associated_specs"]
-    }
-
-    # Get ordered SFT steps
-    cursor.execute("""
-        SELECT
-            sft.sft_code,
-            sft.parent_group,
-            sft.description,
-            sft.associated_specs,
-            sft.source_doc,
-            sft.last_review,
-            sft.notes,
-            fcs.step_order
-        FROM finish_code_steps fcs
-        JOIN sft_steps sft ON fcs.sft_id = sft.id
-        WHERE fcs.finish_code_id = (SELECT id FROM finish_codes WHERE code = ?)
-        ORDER BY fcs.step_order
-    """, (finish_code,))
-    sft_rows = cursor.fetchall()
-
-    steps = []
-    for sft_row in sft_rows:
-        sft_code = sft_row["sft_code"]
-
-        # Get materials for this SFT step
-        cursor.execute("""
+        # Get ordered SFT steps with their materials and chemicals in one pass.
+        # LEFT JOINs keep steps without materials and materials without chemicals;
+        # materials are grouped per link row, so duplicate links stay listed.
+        # Rows come back as plain tuples and are unpacked by position below, so
+        # the column order of this SELECT is part of the loop code.
+        tree_cursor = conn.cursor()
+        tree_cursor.row_factory = None
+        tree_cursor.execute("""
             SELECT
-                m.id AS material_id,
+                fcs.step_order,
+                sft.sft_code,
+                sft.parent_group,
+                sft.description,
+                sft.associated_specs,
+                sft.source_doc,
+                sft.last_review,
+                sft.notes,
+                sml.id AS link_id,
                 m.base_spec,
                 m.variant,
                 m.description AS material_description,
-                m.notes AS material_notes
-            FROM sft_material_links sml
-            JOIN materials m ON sml.material_id = m.id
-            WHERE sml.sft_id = (SELECT id FROM sft_steps WHERE sft_code = ?)
-        """, (sft_code,))
-        material_rows = cursor.fetchall()
-
-        materials = []
-        for mat_row in material_rows:
-            material_id = mat_row["material_id"]
-
-            # Get chemicals for this material
-            cursor.execute("""
-                SELECT
-                    c.name,
-                    c.cas,
-                    c.hazard_flags,
-                    c.default_hazard_level,
-                    mc.pct_wt_low,
-                    mc.pct_wt_high,
-                    mc.notes AS composition_notes
-                FROM material_chemicals mc
-                JOIN chemicals c ON mc.chemical_id = c.id
-                WHERE mc.material_id = ?
-                ORDER BY c.default_hazard_level DESC, c.name ASC
-            """, (material_id,))
-            chemical_rows = cursor.fetchall()
-
-            chemicals = []
-            for chem_row in chemical_rows:
-                # Parse hazard_flags JSON
-                hazard_flags = None
-                if chem_row["hazard_flags"]:
-                    try:
-                        hazard_flags = json.loads(chem_row["hazard_flags"])
-                    except json.JSONDecodeError:
-                        hazard_flags = {"error": "Invalid JSON", "raw": chem_row["hazard_flags"]}
-
-                chemicals.append({
-                    "name": chem_row["name"],
-                    "cas": chem_row["cas"],
-                    "pct_wt_low": chem_row["pct_wt_low"],
-                    "pct_wt_high": chem_row["pct_wt_high"],
-                    "hazard_flags": hazard_flags,
-                    "default_hazard_level": chem_row["default_hazard_level"],
-                    "composition_notes": chem_row["composition_notes"]
-                })
-
-            materials.append({
-                "base_spec": mat_row["base_spec"],
-                "variant": mat_row["variant"],
-                "description": mat_row["material_description"],
-                "notes": mat_row["material_notes"],
-                "chemicals": chemicals
+                m.notes AS material_notes,
+                mc.id AS composition_id,
+                c.name,
+                c.cas,
+                c.hazard_flags,
+                c.default_hazard_level,
+                mc.pct_wt_low,
+                mc.pct_wt_high,
+                mc.notes AS composition_notes
+            FROM finish_code_steps fcs
+            JOIN sft_steps sft ON fcs.sft_id = sft.id
+            LEFT JOIN (sft_material_links sml JOIN materials m ON sml.material_id = m.id)
+                ON sml.sft_id = sft.id
+            LEFT JOIN (material_chemicals mc JOIN chemicals c ON mc.chemical_id = c.id)
+                ON mc.material_id = m.id
+            WHERE fcs.finish_code_id = ?
+            ORDER BY fcs.step_order, sml.id, c.default_hazard_level DESC, c.name ASC, mc.id
+        """, (finish_code_id,))
+
+        steps = []
+        for _, step_rows in groupby(tree_cursor, key=itemgetter(0)):
+            step_rows = list(step_rows)
+            (step_order, sft_code, parent_group, description, associated_specs,
+             source_doc, last_review, notes, link_id) = step_rows[0][:9]
+
+            materials = []
+            if link_id is not None:
+                for _, mat_rows in groupby(step_rows, key=itemgetter(8)):
+                    mat_rows = list(mat_rows)
+                    (base_spec, variant, material_description,
+                     material_notes, composition_id) = mat_rows[0][9:14]
+
+                    chemicals = []
+                    if composition_id is not None:
+                        for chem_row in mat_rows:
+                            (name, cas, raw_flags, default_hazard_level,
+                             pct_wt_low, pct_wt_high, composition_notes) = chem_row[14:]
+
+                            # Parse hazard_flags JSON
+                            hazard_flags = None
+                            if raw_flags:
+                                try:
+                                    hazard_flags = _loads_hazard_flags(raw_flags)
+                                except json.JSONDecodeError:
+                                    hazard_flags = {"error": "Invalid JSON", "raw": raw_flags}
+
+                            chemicals.append({
+                                "name": name,
+                                "cas": cas,
+                                "pct_wt_low": pct_wt_low,
+                                "pct_wt_high": pct_wt_high,
+                                "hazard_flags": hazard_flags,
+                                "default_hazard_level": default_hazard_level,
+                                "composition_notes": composition_notes
+                            })
+
+                    materials.append({
+                        "base_spec": base_spec,
+                        "variant": variant,
+                        "description": material_description,
+                        "notes": material_notes,
+                        "chemicals": chemicals
+                    })
+
+            steps.append({
+                "sft_code": sft_code,
+                "step_order": step_order,
+                "parent_group": parent_group,
+                "description": description,
+                "associated_specs": associated_specs,
+                "associated_specs_list": _split_specs(associated_specs),
+                "source_doc": source_doc,
+                "last_review": last_review,
+                "notes": notes,
+                "materials": materials
             })
 
-        steps.append({
-            "sft_code": sft_row["sft_code"],
-            "step_order": sft_row["step_order"],
-            "parent_group": sft_row["parent_group"],
-            "description": sft_row["description"],
-            "associated_specs": sft_row["associated_specs"],
-            "source_doc": sft_row["source_doc"],
-            "last_review": sft_row["last_review"],
-            "notes": sft_row["notes"],
-            "materials": materials
-        })
-
-    # Get provenance data (CSV SHAs and load timestamps)
-    cursor.execute("""
-        SELECT source_name, sha256, loaded_at
-        FROM metadata_versions
-        ORDER BY loaded_at DESC
-    """)
-    metadata_rows = cursor.fetchall()
-
-    csv_shas = {}
-    most_recent_load = None
-    for meta_row in metadata_rows:
-        csv_shas[meta_row["source_name"]] = meta_row["sha256"]
-        if most_recent_load is None or meta_row["loaded_at"] > most_recent_load:
-            most_recent_load = meta_row["loaded_at"]
-
-    provenance = {
-        "csv_shas": csv_shas,
-        "loaded_at": most_recent_load or datetime.now().isoformat()
-    }
-
-    conn.close()
+        # Get provenance data (CSV SHAs and load timestamps)
+        cursor.execute("""
+            SELECT source_name, sha256, loaded_at
+            FROM metadata_versions
+            ORDER BY loaded_at DESC, id DESC
+        """)
+        metadata_rows = cursor.fetchall()
+
+        csv_shas = {meta_row["source_name"]: meta_row["sha256"] for meta_row in metadata_rows}
+        # Rows are newest first, so the first one is the most recent load
+        most_recent_load = metadata_rows[0]["loaded_at"] if metadata_rows else None
+
+        provenance = {
+            "csv_shas": csv_shas,
+            "loaded_at": most_recent_load or _utc_now_iso()
+        }
 
     # Build direct specifications if present (bypasses SFT steps)
-    direct_specs = []
-    if parsed["associated_specs"] and parsed["associated_specs"].strip():
-        direct_specs = [s.strip() for s in parsed["associated_specs"].split(',') if s.strip()]
+    direct_specs = _split_specs(parsed["associated_specs"])
 
     # Also check finish_applied specs
-    finish_applied_specs = []
-    if parsed_row["finish_applied_specs"] and parsed_row["finish_applied_specs"].strip():
-        finish_applied_specs = [s.strip() for s in parsed_row["finish_applied_specs"].split(',') if s.strip()]
+    finish_applied_specs = _split_specs(parsed_row["finish_applied_specs"])
 
     return {
         "finish_code": finish_code,
@@ -279,12 +435,69 @@ def get_finish_code_tree(finish_code: str, db_path: str = "data/hazardous_finish
     }
 
 
-def get_all_finish_codes(db_path: str = "data/hazardous_finishes.sqlite") -> list[dict[str, Any]]:
+def iter_all_finish_codes(
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None,
+    batch_size: int = 256
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield all finish codes in code order, fetching rows in batches.
+
+    Args:
+        db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
+        batch_size: Rows fetched from the cursor per round trip
+
+    Yields:
+        Same dictionaries as get_all_finish_codes()
+
+    Raises:
+        FileNotFoundError: If database not found
+    """
+    with _connection(db_path, conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.arraysize = batch_size
+
+        cursor.execute("""
+            SELECT
+                fc.code,
+                fc.description,
+                s.description AS substrate,
+                fa.description AS finish_applied,
+                fc.seq_id,
+                fc.source_doc,
+                fc.program
+            FROM finish_codes fc
+            JOIN substrates s ON fc.substrate_id = s.id
+            JOIN finish_applied fa ON fc.finish_applied_id = fa.id
+            ORDER BY fc.code
+        """)
+
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield {
+                    "code": row["code"],
+                    "description": row["description"],
+                    "substrate": row["substrate"],
+                    "finish_applied": row["finish_applied"],
+                    "seq_id": row["seq_id"],
+                    "source_doc": row["source_doc"],
+                    "program": row["program"]
+                }
+
+
+@_memoize_per_db_version
+def get_all_finish_codes(
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> list[dict[str, Any]]:
     """
     Retrieve list of all finish codes with descriptions.
 
     Args:
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
 
     Returns:
         List of dictionaries:
@@ -301,48 +514,14 @@ def get_all_finish_codes(db_path: str = "data/hazardous_finishes.sqlite") -> lis
     Raises:
         FileNotFoundError: If database not found
     """
-    db_file = Path(db_path)
-    if not db_file.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT
-            fc.code,
-            fc.description,
-            s.description AS substrate,
-            fa.description AS finish_applied,
-            fc.seq_id,
-            fc.source_doc,
-            fc.program
-        FROM finish_codes fc
-        JOIN substrates s ON fc.substrate_id = s.id
-        JOIN finish_applied fa ON fc.finish_applied_id = fa.id
-        ORDER BY fc.code
-    """)
-
-    codes = []
-    for row in cursor.fetchall():
-        codes.append({
-            "code": row["code"],
-            "description": row["description"],
-            "substrate": row["substrate"],
-            "finish_applied": row["finish_applied"],
-            "seq_id": row["seq_id"],
-            "source_doc": row["source_doc"],
-            "program": row["program"]
-        })
-
-    conn.close()
-    return codes
+    return list(iter_all_finish_codes(db_path, conn))
 
 
+@_memoize_per_db_version
 def get_chemicals_by_hazard_level(
     db_path: str = "data/hazardous_finishes.sqlite",
-    min_level: int = 1
+    min_level: int = 1,
+    conn: Optional[sqlite3.Connection] = None
 ) -> list[dict[str, Any]]:
     """
     Retrieve chemicals filtered by hazard level.
@@ -350,6 +529,7 @@ def get_chemicals_by_hazard_level(
     Args:
         db_path: Path to SQLite database
         min_level: Minimum hazard level (1-5)
+        conn: Open connection to reuse instead of opening db_path (left open)
 
     Returns:
         List of chemical dictionaries sorted by hazard level descending
@@ -361,136 +541,121 @@ def get_chemicals_by_hazard_level(
     if not 1 <= min_level <= 5:
         raise ValueError(f"min_level must be 1-5, got: {min_level}")
 
-    db_file = Path(db_path)
-    if not db_file.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
+    with _connection(db_path, conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        cursor.execute("""
+            SELECT name, cas, hazard_flags, default_hazard_level
+            FROM chemicals
+            WHERE default_hazard_level >= ?
+            ORDER BY default_hazard_level DESC, name ASC
+        """, (min_level,))
+
+        chemicals = []
+        for row in cursor:
+            hazard_flags = None
+            if row["hazard_flags"]:
+                try:
+                    hazard_flags = _loads_hazard_flags(row["hazard_flags"])
+                except json.JSONDecodeError:
+                    hazard_flags = {"error": "Invalid JSON"}
+
+            chemicals.append({
+                "name": row["name"],
+                "cas": row["cas"],
+                "hazard_flags": hazard_flags,
+                "default_hazard_level": row["default_hazard_level"]
+            })
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        SELECT name, cas, hazard_flags, default_hazard_level
-        FROM chemicals
-        WHERE default_hazard_level >= ?
-        ORDER BY default_hazard_level DESC, name ASC
-    """, (min_level,))
-
-    chemicals = []
-    for row in cursor.fetchall():
-        hazard_flags = None
-        if row["hazard_flags"]:
-            try:
-                hazard_flags = json.loads(row["hazard_flags"])
-            except json.JSONDecodeError:
-                hazard_flags = {"error": "Invalid JSON"}
-
-        chemicals.append({
-            "name": row["name"],
-            "cas": row["cas"],
-            "hazard_flags": hazard_flags,
-            "default_hazard_level": row["default_hazard_level"]
-        })
-
-    conn.close()
     return chemicals
 
 
-def get_all_specifications(db_path: str = "data/hazardous_finishes.sqlite") -> dict[str, Any]:
+def iter_all_specifications(
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> Iterator[dict[str, Any]]:
     """
-    Extract all unique specifications from all SFT steps in the database.
+    Yield every unique specification from all SFT steps, most used first.
+
+    Lets callers stream specifications to their output one at a time
+    instead of holding the full list returned by get_all_specifications().
 
     Args:
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
 
-    Returns:
-        Dictionary with structure:
+    Yields:
         {
-            "total_specs": int,
-            "specifications": [
-                {
-                    "spec": str,
-                    "sft_codes": [str, ...],  # Which SFT steps use this spec
-                    "finish_codes": [str, ...],  # Which finish codes use this spec
-                    "usage_count": int
-                }
-            ]
+            "spec": str,
+            "sft_codes": [str, ...],  # Which SFT steps use this spec
+            "finish_codes": [str, ...],  # Which finish codes use this spec
+            "usage_count": int
         }
 
     Raises:
         FileNotFoundError: If database file not found
     """
-    db_file = Path(db_path)
-    if not db_file.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # Get all SFT steps with their specifications
-    cursor.execute("""
-        SELECT DISTINCT
-            sft.sft_code,
-            sft.associated_specs
-        FROM sft_steps sft
-        WHERE sft.associated_specs IS NOT NULL
-        AND sft.associated_specs != ''
-        ORDER BY sft.sft_code
-    """)
+    with _connection(db_path, conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        # One row per (spec, SFT step, finish code) from the sft_specs bridge
+        # table; the LEFT JOIN keeps specs whose steps are not used by any
+        # finish code yet
+        _execute_on_sft_specs(cursor, """
+            SELECT
+                sft.sft_code,
+                ss.spec,
+                fc.code AS finish_code
+            FROM sft_specs ss
+            JOIN sft_steps sft ON ss.sft_id = sft.id
+            LEFT JOIN (finish_code_steps fcs JOIN finish_codes fc ON fc.id = fcs.finish_code_id)
+                ON fcs.sft_id = sft.id
+        """)
+
+        # Build specification map
+        spec_map = defaultdict(lambda: {"sft_codes": set(), "finish_codes": set()})
+
+        for sft_code, spec, finish_code in cursor:
+            spec_map[spec]["sft_codes"].add(sft_code)
+            if finish_code is not None:
+                spec_map[spec]["finish_codes"].add(finish_code)
 
-    sft_rows = cursor.fetchall()
+    # Order by usage count descending, then spec name
+    ordered = sorted(spec_map.items(), key=lambda item: (-len(item[1]["finish_codes"]), item[0]))
 
-    # Build specification map
-    spec_map = {}  # spec -> {sft_codes: set, finish_codes: set}
+    for spec, data in ordered:
+        yield {
+            "spec": spec,
+            "sft_codes": sorted(data["sft_codes"]),
+            "finish_codes": sorted(data["finish_codes"]),
+            "usage_count": len(data["finish_codes"])
+        }
 
-    for row in sft_rows:
-        sft_code = row["sft_code"]
-        specs_raw = row["associated_specs"]
 
-        # Split comma-separated specs
-        individual_specs = [s.strip() for s in specs_raw.split(',') if s.strip()]
+def get_all_specifications(
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> dict[str, Any]:
+    """
+    Extract all unique specifications from all SFT steps in the database.
 
-        for spec in individual_specs:
-            if spec not in spec_map:
-                spec_map[spec] = {
-                    "sft_codes": set(),
-                    "finish_codes": set()
-                }
-            spec_map[spec]["sft_codes"].add(sft_code)
+    Args:
+        db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
 
-    # Now find which finish codes use each spec (via SFT steps)
-    for spec in spec_map.keys():
-        # Get all finish codes that use any of the SFT steps containing this spec
-        sft_codes_for_spec = list(spec_map[spec]["sft_codes"])
-        if sft_codes_for_spec:
-            placeholders = ','.join('?' * len(sft_codes_for_spec))
-            query = f"""
-                SELECT DISTINCT fc.code
-                FROM finish_codes fc
-                JOIN finish_code_steps fcs ON fc.id = fcs.finish_code_id
-                JOIN sft_steps sft ON fcs.sft_id = sft.id
-                WHERE sft.sft_code IN ({placeholders})
-                ORDER BY fc.code
-            """
-            cursor.execute(query, sft_codes_for_spec)
-            for fc_row in cursor.fetchall():
-                spec_map[spec]["finish_codes"].add(fc_row["code"])
-
-    conn.close()
-
-    # Convert to output format
-    specifications = []
-    for spec, data in sorted(spec_map.items()):
-        specifications.append({
-            "spec": spec,
-            "sft_codes": sorted(list(data["sft_codes"])),
-            "finish_codes": sorted(list(data["finish_codes"])),
-            "usage_count": len(data["finish_codes"])
-        })
+    Returns:
+        Dictionary with structure:
+        {
+            "total_specs": int,
+            "specifications": [...]  # Items as yielded by iter_all_specifications()
+        }
 
-    # Sort by usage count descending
-    specifications.sort(key=lambda x: (-x["usage_count"], x["spec"]))
+    Raises:
+        FileNotFoundError: If database file not found
+    """
+    specifications = list(iter_all_specifications(db_path, conn))
 
     return {
         "total_specs": len(specifications),
@@ -498,13 +663,18 @@ def get_all_specifications(db_path: str = "data/hazardous_finishes.sqlite") -> d
     }
 
 
-def get_finish_code_specs(finish_code: str, db_path: str = "data/hazardous_finishes.sqlite") -> dict[str, Any]:
+def get_finish_code_specs(
+    finish_code: str,
+    db_path: str = "data/hazardous_finishes.sqlite",
+    conn: Optional[sqlite3.Connection] = None
+) -> dict[str, Any]:
     """
     Extract all unique specifications referenced in a finish code's SFT steps.
 
     Args:
         finish_code: Finish code to query (e.g., "BP27")
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening db_path (left open)
 
     Returns:
         Dictionary with structure:
@@ -527,59 +697,55 @@ def get_finish_code_specs(finish_code: str, db_path: str = "data/hazardous_finis
     Raises:
         FileNotFoundError: If database file not found
     """
-    db_file = Path(db_path)
-    if not db_file.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    # Check if finish code exists
-    cursor.execute("SELECT id FROM finish_codes WHERE code = ?", (finish_code,))
-    fc_row = cursor.fetchone()
-
-    if not fc_row:
-        # Return error with available codes
-        cursor.execute("SELECT code FROM finish_codes ORDER BY code LIMIT 10")
-        available = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return {
-            "error": "Finish code not found",
-            "finish_code": finish_code,
-            "available_codes": available
-        }
+    with _connection(db_path, conn) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        # Check if finish code exists
+        cursor.execute("SELECT id FROM finish_codes WHERE code = ?", (finish_code,))
+        fc_row = cursor.fetchone()
+
+        if not fc_row:
+            # Return error with available codes
+            cursor.execute("SELECT code FROM finish_codes ORDER BY code LIMIT 10")
+            available = [row[0] for row in cursor.fetchall()]
+            return {
+                "error": "Finish code not found",
+                "finish_code": finish_code,
+                "available_codes": available
+            }
 
-    # Get all SFT steps with specifications
-    cursor.execute("""
-        SELECT
-            sft.sft_code,
-            sft.associated_specs,
-            sft.description,
-            fcs.step_order
-        FROM finish_code_steps fcs
-        JOIN sft_steps sft ON fcs.sft_id = sft.id
-        WHERE fcs.finish_code_id = ?
-        ORDER BY fcs.step_order
-    """, (fc_row["id"],))
-
-    sft_rows = cursor.fetchall()
-    conn.close()
+        # Get all SFT steps with their individual specs from sft_specs, in order
+        _execute_on_sft_specs(cursor, """
+            SELECT
+                sft.sft_code,
+                sft.associated_specs,
+                sft.description,
+                fcs.step_order,
+                ss.spec
+            FROM finish_code_steps fcs
+            JOIN sft_steps sft ON fcs.sft_id = sft.id
+            LEFT JOIN sft_specs ss ON ss.sft_id = sft.id
+            WHERE fcs.finish_code_id = ?
+            ORDER BY fcs.step_order, ss.position
+        """, (fc_row["id"],))
+
+        sft_rows = cursor.fetchall()
 
     # Collect unique specifications
-    # Split comma-separated specs since they represent alternatives (OR relationship)
+    # Multiple specs on one step represent alternatives (OR relationship)
     specs_set = set()
     steps_with_specs = []
 
-    for row in sft_rows:
+    for _, step_rows in groupby(sft_rows, key=itemgetter("step_order")):
+        step_rows = list(step_rows)
+        row = step_rows[0]
         specs_raw = row["associated_specs"]
         if specs_raw and specs_raw.strip():
-            # Split by comma to get individual specs
-            individual_specs = [s.strip() for s in specs_raw.split(',') if s.strip()]
+            individual_specs = [r["spec"] for r in step_rows if r["spec"] is not None]
 
             # Add each individual spec to the set
-            for spec in individual_specs:
-                specs_set.add(spec)
+            specs_set.update(individual_specs)
 
             # Truncate description for display
             desc = row["description"]
@@ -28,37 +28,30 @@ END_PUNCT = set(",.;:)")
 # Capture bare P##### specs (e.g., P57004, P55002)
 P_SPEC = re.compile(r"\bP\d{4,6}\b", re.IGNORECASE)
 
-def extract_specs(text: str) -> list[str]:
-    """Extracts specification identifiers from an SFT description."""
-    if not isinstance(text, str) or not text.strip():
-        return []
+# Prefixed specs (MIL-DTL-5002, AMS-QQ-P-416, LMA-MN040, etc.). An uppercase
+# IAW/OR/AND word is a connective, not part of the spec, so it ends the match.
+PREFIXED_SPEC = re.compile(
+    rf"\b{PREFIX}\b[-\s]*(?:(?!\b(?-i:IAW|OR|AND)\b)[A-Za-z0-9-])*",
+    re.IGNORECASE,
+)
 
-    specs: list[str] = []
 
-    # Temporarily replace "IAW", "OR", and "AND" to avoid interfering with regex
-    text = re.sub(r"\b(IAW|OR|AND)\b", lambda x: f"___{x.group(0)}___", text)
+def _clean_specs(p_specs: list[str], prefixed_specs: list[str]) -> list[str]:
+    """Normalizes raw pattern matches into ordered, deduplicated spec identifiers."""
+    specs = [s.upper() for s in p_specs]
+    specs += [s.upper() for s in prefixed_specs if not s.endswith("-")]
 
-    # Pass 1: standalone P##### specs
-    for m in P_SPEC.finditer(text):
-        specs.append(m.group(0).upper())
+    # Deduplicate while preserving order and remove all spaces but keep dashes
+    return list(dict.fromkeys("".join(s.split()) for s in specs))
 
-    # Pass 2: prefixed specs (MIL-DTL-5002, AMS-QQ-P-416, LMA-MN040, etc.)
-    for m in re.finditer(rf"\b{PREFIX}\b[-\s]*([A-Za-z0-9-]*)", text, re.IGNORECASE):
-        if not m.group(0).endswith(("_", "-")):
-            specs.append(m.group(0).upper().strip())
 
-    # Restore temporarily replaced words
-    text = re.sub(r"___(IAW|OR|AND)___", lambda x: x.group(1), text)
+def extract_specs(text: str) -> list[str]:
+    """Extracts specification identifiers from an SFT description."""
+    if not isinstance(text, str) or not text.strip():
+        return []
 
-    # Deduplicate while preserving order and remove all spaces but keep dashes
-    seen = set()
-    ordered = []
-    for s in specs:
-        cleaned_spec = re.sub(r"\s+", "", s)
-        if cleaned_spec not in seen:
-            seen.add(cleaned_spec)
-            ordered.append(cleaned_spec)
-    return ordered
+    # Pass 1: standalone P##### specs; pass 2: prefixed specs
+    return _clean_specs(P_SPEC.findall(text), PREFIXED_SPEC.findall(text))
 
 
 def main():
@@ -74,9 +67,14 @@ def main():
         print("❌ Column 'description' not found in CSV.")
         return
 
-    df["associated_specs"] = df["description"].apply(
-        lambda x: ",".join(extract_specs(x))
-    )
+    # Run both patterns over the whole column at once; only the cleanup is per row
+    descriptions = df["description"].fillna("")
+    df["associated_specs"] = [
+        ",".join(_clean_specs(p_specs, prefixed_specs))
+        for p_specs, prefixed_specs in zip(
+            descriptions.str.findall(P_SPEC), descriptions.str.findall(PREFIXED_SPEC)
+        )
+    ]
     df.to_csv(output_path, index=False)
     print(f"✅ Extracted specifications written to {output_path}")
 
@@ -9,27 +9,25 @@ from pathlib import Path
 INPUT_FILE = Path("data/inputs/LMA-PJ100.rtf")
 OUTPUT_FILE = Path("data/inputs/finish_codes_flat.csv")
 
-# Match finish codes: 0000 or 1–2 letters + 2 digits
-FINISH_CODE_RE = re.compile(r"(?<!\S)(?:([A-Z]{1,2}\d{2})|(0000))(?!\S)")
+# Match finish codes: 0000 or 1–2 letters + 2 digits. The (?=[A-Z0]) peek
+# rejects most positions before either alternative is tried.
+FINISH_CODE_RE = re.compile(r"(?<!\S)(?=[A-Z0])(?:([A-Z]{1,2}\d{2})|(0000))(?!\S)")
 SFT_RE = re.compile(r"\bSFT\d{4}\b", re.IGNORECASE)
 
+# Hex escapes (\'e9), control words (\par, \fs-24), and stray braces/backslashes
+RTF_CONTROL_RE = re.compile(r"\\'[0-9a-fA-F]{2}|\\[a-zA-Z]+-?\d*\s?|[{}\\]")
+
 # ---------------------------------------------------------------------
 # CLEANUP
 # ---------------------------------------------------------------------
 def clean_rtf(raw: str) -> str:
     """Remove RTF control codes and normalize whitespace."""
-    s = re.sub(r"\\'[0-9a-fA-F]{2}", " ", raw)
-    s = re.sub(r"\\[a-zA-Z]+-?\d*(?:\s|)", " ", s)
-    s = s.replace("{", " ").replace("}", " ").replace("\\", " ")
-    s = re.sub(r"\s+", " ", s)
-    return s.upper().strip()
+    # One substitution pass, then split/join collapses and trims whitespace
+    return " ".join(RTF_CONTROL_RE.sub(" ", raw).split()).upper()
 
 # ---------------------------------------------------------------------
 # HELPERS
 # ---------------------------------------------------------------------
-def find_codes(text: str):
-    return list(FINISH_CODE_RE.finditer(text))
-
 def split_code_parts(code: str):
     if code == "0000":
         return "0", "0", "00"
@@ -44,35 +42,34 @@ def split_code_parts(code: str):
 # ---------------------------------------------------------------------
 # MAIN EXTRACTION
 # ---------------------------------------------------------------------
-def extract_finish_codes(text: str):
-    matches = find_codes(text)
-    results = []
-
-    for i, m in enumerate(matches):
-        code = m.group(1) or m.group(2)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        block = text[start:end].strip()
+def parse_block(code: str, block: str) -> dict:
+    """Build the output row for one finish code from the text that follows it."""
+    # One scan: the first SFT#### ends the description, and all of them are the steps
+    sft_matches = list(SFT_RE.finditer(block))
+    desc = block[: sft_matches[0].start()] if sft_matches else block
+    s, f, seq = split_code_parts(code)
+
+    return {
+        "finish_code": code,
+        "substrate_code": s,
+        "finish_applied_code": f,
+        "seq_id": seq,
+        "finish_code_description": " ".join(desc.split()),
+        "sft_steps": json.dumps(sorted({m.group(0) for m in sft_matches}))
+    }
 
-        # description = text before first SFT####
-        first_sft = SFT_RE.search(block)
-        desc = block[: first_sft.start()].strip() if first_sft else block
-        desc = re.sub(r"\s+", " ", desc)
-
-        # collect SFT steps
-        sft_list = SFT_RE.findall(block)
-        s, f, seq = split_code_parts(code)
-
-        results.append({
-            "finish_code": code,
-            "substrate_code": s,
-            "finish_applied_code": f,
-            "seq_id": seq,
-            "finish_code_description": desc,
-            "sft_steps": json.dumps(sorted(set(sft_list)))
-        })
-
-    return results
+def extract_finish_codes(text: str):
+    """Yield one output row per finish code, in document order."""
+    # Each block runs from the end of one code to the start of the next
+    prev = None
+    for m in FINISH_CODE_RE.finditer(text):
+        if prev is not None:
+            code = prev.group(1) or prev.group(2)
+            yield parse_block(code, text[prev.end():m.start()].strip())
+        prev = m
+    if prev is not None:
+        code = prev.group(1) or prev.group(2)
+        yield parse_block(code, text[prev.end():].strip())
 
 # ---------------------------------------------------------------------
 # RUNNER
@@ -82,9 +79,9 @@ def main():
         print(f"❌ Missing file: {INPUT_FILE}")
         return
 
-    raw = INPUT_FILE.read_text(errors="ignore")
-    text = clean_rtf(raw)
-    rows = extract_finish_codes(text)
+    # Only the cleaned text is kept; rows are written as they are parsed
+    text = clean_rtf(INPUT_FILE.read_text(errors="ignore"))
+    count = 0
 
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_FILE.open("w", newline="", encoding="utf-8") as f:
@@ -100,9 +97,11 @@ def main():
             ],
         )
         writer.writeheader()
-        writer.writerows(rows)
+        for row in extract_finish_codes(text):
+            writer.writerow(row)
+            count += 1
 
-    print(f"✅ Extracted {len(rows)} finish codes → {OUTPUT_FILE}")
+    print(f"✅ Extracted {count} finish codes → {OUTPUT_FILE}")
 
 # ---------------------------------------------------------------------
 if __name__ == "__main__":
@@ -68,6 +68,16 @@ CREATE TABLE IF NOT EXISTS sft_steps (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Individual specifications per SFT step, split from sft_steps.associated_specs
+-- at load time (position keeps the original left-to-right order)
+CREATE TABLE IF NOT EXISTS sft_specs (
+    sft_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    spec TEXT NOT NULL,
+    PRIMARY KEY (sft_id, position),
+    FOREIGN KEY (sft_id) REFERENCES sft_steps(id) ON DELETE CASCADE
+);
+
 -- Junction table: finish codes → ordered SFT steps
 CREATE TABLE IF NOT EXISTS finish_code_steps (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -153,13 +163,16 @@ CREATE TABLE IF NOT EXISTS material_chemicals (
 -- METADATA AND VERSIONING
 -- =============================================================================
 
--- Tracks CSV ingestion history for lineage and drift detection
+-- Tracks CSV ingestion history for lineage and drift detection.
+-- sha256 holds the content hash computed with hash_algo ('sha256' or 'blake3').
 CREATE TABLE IF NOT EXISTS metadata_versions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     source_name TEXT NOT NULL UNIQUE,
     sha256 TEXT NOT NULL,
+    hash_algo TEXT NOT NULL DEFAULT 'sha256',
     rows_loaded INTEGER NOT NULL,
-    loaded_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    -- ISO 8601 UTC with milliseconds, e.g. 2026-01-31T09:15:02.418Z
+    loaded_at DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
 );
 
 -- =============================================================================
@@ -175,12 +188,19 @@ CREATE INDEX IF NOT EXISTS idx_finish_codes_code
     ON finish_codes(code);
 
 -- Finish code steps traversal
-CREATE INDEX IF NOT EXISTS idx_finish_code_steps_finish
-    ON finish_code_steps(finish_code_id);
 CREATE INDEX IF NOT EXISTS idx_finish_code_steps_sft
     ON finish_code_steps(sft_id);
-CREATE INDEX IF NOT EXISTS idx_finish_code_steps_order
-    ON finish_code_steps(finish_code_id, step_order);
+-- Covers the tree/specs step walk (filter, order and sft_id) without table
+-- lookups; replaces idx_finish_code_steps_finish and
+-- idx_finish_code_steps_order, which are its prefixes
+DROP INDEX IF EXISTS idx_finish_code_steps_finish;
+DROP INDEX IF EXISTS idx_finish_code_steps_order;
+CREATE INDEX IF NOT EXISTS idx_finish_code_steps_walk
+    ON finish_code_steps(finish_code_id, step_order, sft_id);
+
+-- SFT specifications by spec
+CREATE INDEX IF NOT EXISTS idx_sft_specs_spec
+    ON sft_specs(spec);
 
 -- SFT material links
 CREATE INDEX IF NOT EXISTS idx_sft_material_links_sft
@@ -188,17 +208,28 @@ CREATE INDEX IF NOT EXISTS idx_sft_material_links_sft
 CREATE INDEX IF NOT EXISTS idx_sft_material_links_material
     ON sft_material_links(material_id);
 
--- Material chemicals lookup
-CREATE INDEX IF NOT EXISTS idx_material_chemicals_material
-    ON material_chemicals(material_id);
+-- Spec dependencies (both sides reference materials)
+CREATE INDEX IF NOT EXISTS idx_spec_dependencies_spec
+    ON spec_dependencies(spec_material_id);
+CREATE INDEX IF NOT EXISTS idx_spec_dependencies_ref_spec
+    ON spec_dependencies(ref_spec_material_id);
+
+-- Material chemicals lookup; the composition index also serves material_id
+-- lookups, replacing idx_material_chemicals_material
+DROP INDEX IF EXISTS idx_material_chemicals_material;
 CREATE INDEX IF NOT EXISTS idx_material_chemicals_chemical
     ON material_chemicals(chemical_id);
+CREATE INDEX IF NOT EXISTS idx_material_chemicals_composition
+    ON material_chemicals(material_id, chemical_id);
 
 -- Chemical lookups
 CREATE INDEX IF NOT EXISTS idx_chemicals_cas
     ON chemicals(cas);
 CREATE INDEX IF NOT EXISTS idx_chemicals_name
     ON chemicals(name);
+-- Matches the hazard-first ordering used by queries and v_chemicals_by_hazard
+CREATE INDEX IF NOT EXISTS idx_chemicals_hazard
+    ON chemicals(default_hazard_level DESC, name);
 
 -- =============================================================================
 -- VIEWS FOR COMMON QUERIES (Optional, for convenience)
@@ -253,3 +284,18 @@ CREATE TABLE IF NOT EXISTS schema_version (
 -- Insert initial schema version
 INSERT OR IGNORE INTO schema_version (version, description)
 VALUES ('1.0.0', 'Initial schema with all core tables, indexes, and views');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.1.0', 'Add sft_specs table of individual specifications per SFT step');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.2.0', 'Add covering indexes for step walks, compositions and hazard ordering, replacing the indexes they supersede');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.3.0', 'Add metadata_versions.hash_algo for selectable content hashing');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.4.0', 'Index spec_dependencies foreign keys');
+
+INSERT OR IGNORE INTO schema_version (version, description)
+VALUES ('1.5.0', 'Store metadata_versions.loaded_at as ISO 8601 UTC');
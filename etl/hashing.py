@@ -2,19 +2,132 @@
 File hashing utilities for data lineage tracking.
 
 Provides SHA256 hashing of CSV files to detect data drift and changes.
+BLAKE3 can be selected instead with HAZARD_HASH_ALGO=blake3 (requires the
+optional blake3 package); the hashes only detect drift, so any strong
+digest will do.
+
+Digests are remembered per file path, size and mtime in
+content_hashes.json under the cache directory (HAZARD_CACHE_DIR, default
+~/.cache/hazardous_finishes), so unchanged inputs are not re-read on the
+next ingest. verify_file_unchanged() always re-reads the file, since an
+edit can keep both the size and the mtime.
 """
 
+import atexit
 import hashlib
+import hmac
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Optional, Union
+
+try:
+    import blake3  # optional: pip install -e '.[blake3]'
+except ImportError:
+    blake3 = None
+
+HASH_ALGOS = ("sha256", "blake3")
+
+# Files at least this large get a sequential-read hint before hashing
+_READAHEAD_MIN_SIZE = 16 * 1024 * 1024
+
+# "algo:resolved path" -> {size, mtime_ns, hash}; loaded on first use and
+# written back at exit if anything was added
+_HASH_CACHE: Optional[dict[str, dict[str, Any]]] = None
+_HASH_CACHE_DIRTY = False
+_HASH_CACHE_LOCK = threading.Lock()
+
+
+def _hash_cache_file() -> Path:
+    """Return the digest cache file (under HAZARD_CACHE_DIR when set)."""
+    override = os.environ.get("HAZARD_CACHE_DIR")
+    cache_dir = Path(override) if override else Path.home() / ".cache" / "hazardous_finishes"
+    return cache_dir / "content_hashes.json"
+
+
+def _load_cache() -> dict[str, dict[str, Any]]:
+    """Return the digest cache, reading it from disk on first use (call with the lock held)."""
+    global _HASH_CACHE
+    if _HASH_CACHE is None:
+        try:
+            _HASH_CACHE = json.loads(_hash_cache_file().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _HASH_CACHE = {}
+        if not isinstance(_HASH_CACHE, dict):
+            _HASH_CACHE = {}
+        atexit.register(_save_cache)
+    return _HASH_CACHE
 
 
-def compute_sha256(file_path: Union[str, Path]) -> str:
+def _save_cache() -> None:
+    """Write the digest cache back if it changed (best-effort, like the query cache)."""
+    global _HASH_CACHE_DIRTY
+    with _HASH_CACHE_LOCK:
+        if not _HASH_CACHE_DIRTY:
+            return
+        cache_file = _hash_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(_HASH_CACHE), encoding="utf-8")
+            os.replace(tmp_path, cache_file)
+            _HASH_CACHE_DIRTY = False
+        except OSError:
+            pass
+
+
+def _cached_hash(file_path: Path, algo: str, compute: Callable[[], str]) -> str:
+    """
+    Return a file's digest from the cache if its size and mtime are unchanged, else compute() it.
+
+    Args:
+        file_path: Existing file to hash
+        algo: Algorithm name (part of the cache key)
+        compute: Hashes the file when the cache misses
+    """
+    global _HASH_CACHE_DIRTY
+    st = file_path.stat()
+    key = f"{algo}:{file_path.resolve()}"
+
+    with _HASH_CACHE_LOCK:
+        entry = _load_cache().get(key)
+    if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+        return entry["hash"]
+
+    digest = compute()
+    with _HASH_CACHE_LOCK:
+        _load_cache()[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+        _HASH_CACHE_DIRTY = True
+    return digest
+
+
+def _advise_sequential(f) -> None:
+    """
+    Ask the kernel for aggressive readahead on a large file about to be hashed.
+
+    With POSIX_FADV_SEQUENTIAL, Linux doubles the readahead window, so
+    disk reads run ahead of the digest loop instead of alternating with
+    it. The hint is skipped for small files, and on platforms without
+    posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = f.fileno()
+        if os.fstat(fd).st_size >= _READAHEAD_MIN_SIZE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass  # Advisory only
+
+
+def compute_sha256(file_path: Union[str, Path], use_cache: bool = True) -> str:
     """
     Compute SHA256 hash of a file.
 
     Args:
         file_path: Path to file to hash
+        use_cache: Reuse the cached digest while size and mtime are unchanged
 
     Returns:
         Hexadecimal SHA256 hash string (64 characters)
@@ -37,12 +150,24 @@ def compute_sha256(file_path: Union[str, Path]) -> str:
     if not file_path.is_file():
         raise ValueError(f"Path is not a file: {file_path}")
 
-    sha256_hash = hashlib.sha256()
+    if not use_cache:
+        return _sha256_uncached(file_path)
+    return _cached_hash(file_path, "sha256", lambda: _sha256_uncached(file_path))
 
-    # Read file in chunks to handle large files efficiently
-    chunk_size = 8192
+
+def _sha256_uncached(file_path: Path) -> str:
+    """Hash an existing file with SHA256, reading it from disk."""
     try:
         with open(file_path, "rb") as f:
+            _advise_sequential(f)
+
+            # Python 3.11+: hash in native code with the GIL released
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Read file in chunks to handle large files efficiently
+            sha256_hash = hashlib.sha256()
+            chunk_size = 1024 * 1024
             while chunk := f.read(chunk_size):
                 sha256_hash.update(chunk)
     except PermissionError as e:
@@ -53,6 +178,77 @@ def compute_sha256(file_path: Union[str, Path]) -> str:
     return sha256_hash.hexdigest()
 
 
+def get_hash_algo() -> str:
+    """
+    Return the content hash algorithm selected by HAZARD_HASH_ALGO (default sha256).
+
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
+    """
+    algo = os.environ.get("HAZARD_HASH_ALGO", "sha256").strip().lower()
+    if algo not in HASH_ALGOS:
+        raise ValueError(
+            f"Unknown HAZARD_HASH_ALGO '{algo}'. Choose one of: {', '.join(HASH_ALGOS)}"
+        )
+    if algo == "blake3" and blake3 is None:
+        raise ValueError(
+            "HAZARD_HASH_ALGO=blake3 requires blake3. Install with: pip install -e '.[blake3]'"
+        )
+    return algo
+
+
+def compute_content_hash(
+    file_path: Union[str, Path], algo: str = "sha256", use_cache: bool = True
+) -> str:
+    """
+    Compute a file's content hash with the given algorithm.
+
+    Args:
+        file_path: Path to file to hash
+        algo: One of HASH_ALGOS
+        use_cache: Reuse the cached digest while size and mtime are unchanged
+
+    Returns:
+        Hexadecimal hash string (64 characters for both algorithms)
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        PermissionError: If file cannot be read
+        IOError: If file read fails
+        ValueError: If algo is not supported or not installed
+    """
+    if algo == "sha256":
+        return compute_sha256(file_path, use_cache)
+    if algo != "blake3" or blake3 is None:
+        raise ValueError(f"Hash algorithm not available: {algo}")
+
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if not file_path.is_file():
+        raise ValueError(f"Path is not a file: {file_path}")
+
+    if not use_cache:
+        return _blake3_uncached(file_path)
+    return _cached_hash(file_path, "blake3", lambda: _blake3_uncached(file_path))
+
+
+def _blake3_uncached(file_path: Path) -> str:
+    """Hash an existing file with BLAKE3, reading it from disk."""
+    # update_mmap() hashes the mapped file in native code, multithreaded
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    try:
+        hasher.update_mmap(file_path)
+    except PermissionError as e:
+        raise PermissionError(f"Cannot read file (permission denied): {file_path}") from e
+    except IOError as e:
+        raise IOError(f"Failed to read file: {file_path}") from e
+
+    return hasher.hexdigest()
+
+
 def compute_multiple_hashes(file_paths: list[Union[str, Path]]) -> dict[str, str]:
     """
     Compute SHA256 hashes for multiple files.
@@ -84,13 +280,16 @@ def compute_multiple_hashes(file_paths: list[Union[str, Path]]) -> dict[str, str
     return results
 
 
-def verify_file_unchanged(file_path: Union[str, Path], expected_hash: str) -> bool:
+def verify_file_unchanged(
+    file_path: Union[str, Path], expected_hash: str, algo: str = "sha256"
+) -> bool:
     """
     Verify that a file's hash matches an expected value.
 
     Args:
         file_path: Path to file to verify
-        expected_hash: Expected SHA256 hash (64 hex characters)
+        expected_hash: Expected hash (64 hex characters)
+        algo: Algorithm that produced expected_hash (metadata_versions.hash_algo)
 
     Returns:
         True if hash matches, False otherwise
@@ -109,10 +308,14 @@ def verify_file_unchanged(file_path: Union[str, Path], expected_hash: str) -> bo
             f"Invalid expected_hash format. Must be 64 hex characters, got: {expected_hash}"
         )
 
+    # 32 bytes rules out the separators bytes.fromhex() would otherwise skip
     try:
-        int(expected_hash, 16)
+        valid_hex = len(bytes.fromhex(expected_hash)) == 32
     except ValueError as e:
         raise ValueError(f"expected_hash must be hexadecimal string: {expected_hash}") from e
+    if not valid_hex:
+        raise ValueError(f"expected_hash must be hexadecimal string: {expected_hash}")
 
-    actual_hash = compute_sha256(file_path)
-    return actual_hash == expected_hash
+    # Hash the file itself: an edit can keep the size and mtime the cache checks
+    actual_hash = compute_content_hash(file_path, algo, use_cache=False)
+    return hmac.compare_digest(actual_hash, expected_hash)
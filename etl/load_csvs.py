@@ -3,22 +3,53 @@ CSV ingestion orchestrator for hazardous finishes database.
 
 Loads CSV files from data/inputs/ into SQLite database with:
 - Deterministic upsert logic (no duplicates by code keys)
+- A single transaction per ingest (loaders never commit; ingest_all does)
+- Secondary indexes dropped for the load and rebuilt once at the end
 - SHA256 tracking in metadata_versions table
 - Row count recording
 - Validation report generation
 """
 
 import json
+import os
+import re
 import sqlite3
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Optional
 
 import pandas as pd
 
-from .hashing import compute_sha256
+try:
+    import pyarrow  # noqa: F401  # optional: pip install -e '.[fast-csv]'
+except ImportError:
+    pyarrow = None
+
+CSV_ENGINES = ("c", "pyarrow")
+
+from .hashing import compute_content_hash, get_hash_algo
 from .validators import validate_all
 
+# Brackets and quotes stripped from embedded SFT step arrays that are not valid JSON
+_SFT_ARRAY_PUNCT_RE = re.compile(r'[\[\]\"\']')
+
+# The usual embedded array form, e.g. "[SFT0103, SFT0212]": unquoted codes,
+# which json.loads always rejects, so the codes are taken directly
+_SFT_BARE_ARRAY_RE = re.compile(r"\[\s*(?:SFT[\w-]*(?:\s*,\s*SFT[\w-]*)*)?\s*\]")
+_SFT_CODE_RE = re.compile(r"SFT[\w-]*")
+
+# metadata_versions.loaded_at and the ingest report timestamp: ISO 8601 in
+# UTC with milliseconds (e.g. 2026-01-31T09:15:02.418Z), so the stored
+# strings sort chronologically
+_SQL_UTC_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+
+def _utc_now_iso() -> str:
+    """Return the current time in the _SQL_UTC_NOW format."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
 
 def initialize_database(db_path: str, schema_path: str = "db/schema.sql") -> sqlite3.Connection:
     """
@@ -29,7 +60,8 @@ def initialize_database(db_path: str, schema_path: str = "db/schema.sql") -> sql
         schema_path: Path to schema.sql file
 
     Returns:
-        SQLite connection with foreign keys enabled
+        SQLite connection (autocommit, isolation_level=None) with foreign keys
+        enabled and WAL journaling
 
     Raises:
         FileNotFoundError: If schema file not found
@@ -39,46 +71,201 @@ def initialize_database(db_path: str, schema_path: str = "db/schema.sql") -> sql
     if not schema_file.exists():
         raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode: the sqlite3 module never opens transactions on its
+    # own; they are begun explicitly here and in ingest_all
+    conn = sqlite3.connect(db_path, isolation_level=None)
     conn.execute("PRAGMA foreign_keys = ON")
+    # WAL lets read-only connections (validation, queries) run beside the writer
+    conn.execute("PRAGMA journal_mode = WAL")
 
-    # Execute schema DDL
+    # Execute schema DDL and migrations as one transaction rather than one
+    # per statement (the schema's own foreign_keys pragma is already applied)
     with open(schema_file, "r") as f:
         schema_sql = f.read()
-        conn.executescript(schema_sql)
+        conn.executescript("BEGIN;\n" + schema_sql)
+
+    # CREATE TABLE IF NOT EXISTS leaves tables from older schema versions as
+    # they were, so add columns introduced since then
+    metadata_columns = {row[1] for row in conn.execute("PRAGMA table_info(metadata_versions)")}
+    if "hash_algo" not in metadata_columns:
+        conn.execute(
+            "ALTER TABLE metadata_versions ADD COLUMN hash_algo TEXT NOT NULL DEFAULT 'sha256'"
+        )
+
+    # Older ingests stored loaded_at as local time with a 'T' (Python
+    # isoformat) or as UTC with a space (CURRENT_TIMESTAMP); convert both so
+    # ORDER BY loaded_at compares like with like. The 'utc' modifier reads
+    # the old local times in this machine's current time zone.
+    conn.execute("""
+        UPDATE metadata_versions
+        SET loaded_at = COALESCE(
+            CASE WHEN instr(loaded_at, 'T')
+                 THEN strftime('%Y-%m-%dT%H:%M:%fZ', loaded_at, 'utc')
+                 ELSE strftime('%Y-%m-%dT%H:%M:%fZ', loaded_at)
+            END,
+            loaded_at)
+        WHERE loaded_at NOT LIKE '%Z'
+    """)
+
+    # Databases ingested before schema 1.1.0 get an empty sft_specs table from
+    # the schema above; fill it from their existing SFT steps
+    if (conn.execute("SELECT 1 FROM sft_steps LIMIT 1").fetchone()
+            and not conn.execute("SELECT 1 FROM sft_specs LIMIT 1").fetchone()):
+        rebuild_sft_specs(conn)
 
     conn.commit()
     return conn
 
 
+def _set_fast_pragmas(conn: sqlite3.Connection) -> None:
+    """
+    Tune the writer connection for a bulk load.
+
+    synchronous = OFF skips fsyncs while loading. A crash mid-ingest only
+    loses data that is re-derived from the CSVs on the next ingest anyway.
+    The journal stays in WAL mode so readers never block on the load.
+    """
+    conn.executescript("""
+        PRAGMA synchronous = OFF;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -200000;
+    """)
+
+
+def _drop_secondary_indexes(conn: sqlite3.Connection) -> list[str]:
+    """
+    Drop the plain (non-unique) indexes so the load doesn't maintain them row by row.
+
+    Indexes backing UNIQUE constraints have no SQL in sqlite_master and are
+    kept, since the loaders' ON CONFLICT upserts depend on them.
+
+    Returns:
+        CREATE INDEX statements to pass to _restore_indexes() after the load
+    """
+    indexes = conn.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'
+    """).fetchall()
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in indexes]
+
+
+def _restore_indexes(conn: sqlite3.Connection, index_sql: list[str]) -> None:
+    """Recreate indexes dropped by _drop_secondary_indexes() (one sort-based build each)."""
+    for sql in index_sql:
+        conn.execute(sql)
+
+
+def _validate_readonly(db_path: str) -> dict[str, Any]:
+    """Run validate_all() on its own read-only connection to db_path."""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        # Our own connection with no TEMP objects, so switching temp_store is safe
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return validate_all(conn)
+    finally:
+        conn.close()
+
+
+def get_csv_engine() -> str:
+    """
+    Return the pandas CSV parser selected by HAZARD_CSV_ENGINE.
+
+    Defaults to pyarrow when it is installed, else pandas' C parser.
+
+    Raises:
+        ValueError: If the engine is unknown or pyarrow is not installed
+    """
+    engine = os.environ.get("HAZARD_CSV_ENGINE", "").strip().lower()
+    if not engine:
+        return "c" if pyarrow is None else "pyarrow"
+    if engine not in CSV_ENGINES:
+        raise ValueError(
+            f"Unknown HAZARD_CSV_ENGINE '{engine}'. Choose one of: {', '.join(CSV_ENGINES)}"
+        )
+    if engine == "pyarrow" and pyarrow is None:
+        raise ValueError(
+            "HAZARD_CSV_ENGINE=pyarrow requires pyarrow. Install with: pip install -e '.[fast-csv]'"
+        )
+    return engine
+
+
+def _read_text_csv(csv_path: str, **kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV with every column as text, using the get_csv_engine() parser.
+
+    NaN detection is off, so empty cells come back as "" and cell text such
+    as "NA" or "None" is kept verbatim. The pyarrow engine ignores
+    na_filter, so keep_default_na=False is passed too (it turns off
+    pyarrow's null strings, "" included).
+    """
+    return pd.read_csv(
+        csv_path, dtype=str, na_filter=False, keep_default_na=False,
+        engine=get_csv_engine(), **kwargs
+    )
+
+
+def _stripped(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a string column with whitespace stripped ("" for every row if absent)."""
+    if column in df.columns:
+        return df[column].str.strip()
+    return pd.Series("", index=df.index, dtype=object)
+
+
+def _or_none(values: pd.Series) -> list[Optional[str]]:
+    """Map empty strings to None so they are stored as NULL."""
+    return [value or None for value in values]
+
+
+def _id_lookup(conn: sqlite3.Connection, table: str, *key_columns: str) -> dict[Any, int]:
+    """
+    Map key column values to row ids with one read, instead of a SELECT per row.
+
+    One key column maps by value, several by tuple. When a key repeats (a
+    finish code used by several programs, materials with a NULL variant) the
+    lowest id wins, as it did with the per-row lookups.
+    """
+    rows = conn.execute(f"SELECT {', '.join(key_columns)}, id FROM {table} ORDER BY id DESC")
+    if len(key_columns) == 1:
+        return {key: row_id for key, row_id in rows}
+    return {tuple(row[:-1]): row[-1] for row in rows}
+
+
 def record_metadata(
     conn: sqlite3.Connection,
     source_name: str,
     sha256: str,
-    rows_loaded: int
+    rows_loaded: int,
+    hash_algo: str = "sha256"
 ) -> None:
     """
     Record CSV ingestion metadata for lineage tracking.
 
+    loaded_at is set by SQLite (UTC, see _SQL_UTC_NOW) rather than bound
+    from Python.
+
     Args:
         conn: SQLite connection
         source_name: CSV filename (e.g., "substrates.csv")
-        sha256: SHA256 hash of file
+        sha256: Content hash of file
         rows_loaded: Number of rows successfully loaded
+        hash_algo: Algorithm that produced sha256
 
     Raises:
         sqlite3.Error: If insert fails
     """
     cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO metadata_versions (source_name, sha256, rows_loaded, loaded_at)
-        VALUES (?, ?, ?, ?)
+    cursor.execute(f"""
+        INSERT INTO metadata_versions (source_name, sha256, hash_algo, rows_loaded, loaded_at)
+        VALUES (?, ?, ?, ?, {_SQL_UTC_NOW})
         ON CONFLICT(source_name) DO UPDATE SET
             sha256 = excluded.sha256,
+            hash_algo = excluded.hash_algo,
             rows_loaded = excluded.rows_loaded,
             loaded_at = excluded.loaded_at
-    """, (source_name, sha256, rows_loaded, datetime.now().isoformat()))
-    conn.commit()
+    """, (source_name, sha256, hash_algo, rows_loaded))
 
 
 def load_substrates(csv_path: str, conn: sqlite3.Connection) -> int:
@@ -99,28 +286,27 @@ def load_substrates(csv_path: str, conn: sqlite3.Connection) -> int:
         pd.errors.EmptyDataError: If CSV is empty
         sqlite3.Error: If insert fails
     """
-    df = pd.read_csv(csv_path, dtype=str)
-    df = df.fillna("")  # Convert NaN to empty string
+    df = _read_text_csv(csv_path)
 
     required_cols = ["code", "description"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        source_doc = row.get("source_doc", "").strip() if "source_doc" in df.columns else ""
-        program = row.get("program", "").strip() if "program" in df.columns else ""
-
-        cursor.execute("""
-            INSERT INTO substrates (code, description, source_doc, program)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(code, program) DO UPDATE SET
-                description = excluded.description,
-                source_doc = excluded.source_doc
-        """, (row["code"].strip(), row["description"].strip(), source_doc, program))
-
-    conn.commit()
+    # Build all parameter rows column-wise and insert them in one batch
+    params = zip(
+        _stripped(df, "code"),
+        _stripped(df, "description"),
+        _stripped(df, "source_doc"),
+        _stripped(df, "program"),
+    )
+    conn.executemany("""
+        INSERT INTO substrates (code, description, source_doc, program)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(code, program) DO UPDATE SET
+            description = excluded.description,
+            source_doc = excluded.source_doc
+    """, params)
     return len(df)
 
 
@@ -137,34 +323,36 @@ def load_finish_applied(csv_path: str, conn: sqlite3.Connection) -> int:
     Returns:
         Number of rows loaded
     """
-    df = pd.read_csv(csv_path, dtype=str)
-    df = df.fillna("")
+    df = _read_text_csv(csv_path)
 
     required_cols = ["code", "description"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        source_doc = row.get("source_doc", "").strip() if "source_doc" in df.columns else ""
-        program = row.get("program", "").strip() if "program" in df.columns else ""
-        associated_specs = row.get("associated_specs", "").strip() if "associated_specs" in df.columns else ""
-
-        cursor.execute("""
-            INSERT INTO finish_applied (code, description, source_doc, program, associated_specs)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(code, program) DO UPDATE SET
-                description = excluded.description,
-                source_doc = excluded.source_doc,
-                associated_specs = excluded.associated_specs
-        """, (row["code"].strip(), row["description"].strip(), source_doc, program, associated_specs))
-
-    conn.commit()
+    params = zip(
+        _stripped(df, "code"),
+        _stripped(df, "description"),
+        _stripped(df, "source_doc"),
+        _stripped(df, "program"),
+        _stripped(df, "associated_specs"),
+    )
+    conn.executemany("""
+        INSERT INTO finish_applied (code, description, source_doc, program, associated_specs)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(code, program) DO UPDATE SET
+            description = excluded.description,
+            source_doc = excluded.source_doc,
+            associated_specs = excluded.associated_specs
+    """, params)
     return len(df)
 
 
-def load_finish_codes(csv_path: str, conn: sqlite3.Connection) -> int:
+def load_finish_codes(
+    csv_path: str,
+    conn: sqlite3.Connection,
+    sft_steps_data: Optional[list[tuple[str, str]]] = None
+) -> int:
     """
     Load finish_codes from CSV.
 
@@ -174,162 +362,181 @@ def load_finish_codes(csv_path: str, conn: sqlite3.Connection) -> int:
     The sft_steps column (if present) should contain JSON arrays like:
         [SFT0001, SFT0002, ...]
     These will be automatically parsed and loaded into finish_code_steps table.
+    The SFT codes must already be loaded for that; pass sft_steps_data to
+    collect the arrays instead and link them later with
+    load_finish_code_sft_step_links().
 
     Args:
         csv_path: Path to finish_codes.csv
         conn: SQLite connection
+        sft_steps_data: If given, (finish_code, sft_steps) pairs are appended
+            here instead of being linked immediately
 
     Returns:
         Number of rows loaded
     """
     # Use error_bad_lines=False to skip malformed rows (deprecated, using on_bad_lines)
     try:
-        df = pd.read_csv(csv_path, dtype={"seq_id": str}, on_bad_lines='warn', encoding='utf-8-sig')
+        df = _read_text_csv(csv_path, on_bad_lines='warn', encoding='utf-8-sig')
     except TypeError:
         # Fallback for older pandas versions
-        df = pd.read_csv(csv_path, dtype={"seq_id": str}, encoding='utf-8-sig')
-
-    df = df.fillna("")
+        df = _read_text_csv(csv_path, encoding='utf-8-sig')
 
     required_cols = ["finish_code", "substrate_code", "finish_applied_code", "seq_id"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    sft_steps_data = []  # Store SFT step mappings for later processing
-
-    for _, row in df.iterrows():
-        # Get program from row
-        program = row.get("program", "").strip() if "program" in df.columns else ""
-
-        # Lookup substrate_id by (code, program)
-        cursor.execute("SELECT id FROM substrates WHERE code = ? AND program = ?",
-                      (row["substrate_code"].strip(), program))
-        substrate_result = cursor.fetchone()
-        if not substrate_result:
+    substrate_ids = _id_lookup(conn, "substrates", "code", "program")
+    finish_applied_ids = _id_lookup(conn, "finish_applied", "code", "program")
+
+    # Handle description - support both 'description' and 'finish_code_description'
+    description_col = "description" if "description" in df.columns else "finish_code_description"
+
+    # Columnar cleanup: stripped codes, and seq_id as an int (0 unless all digits)
+    finish_codes = df["finish_code"].str.strip()
+    seq_ids = df["seq_id"].str.strip()
+    seq_ids = seq_ids.where(seq_ids.str.isdigit(), "0")
+    seq_ids = pd.to_numeric(seq_ids, errors="coerce").fillna(0).astype("int64")
+
+    params = []
+    link_now = sft_steps_data is None
+    if link_now:
+        sft_steps_data = []  # Store SFT step mappings for later processing
+
+    for (finish_code, substrate_code, fa_code, seq_id, description,
+         notes, source_doc, program, associated_specs, sft_steps) in zip(
+        finish_codes,
+        df["substrate_code"],
+        df["finish_applied_code"],
+        seq_ids.tolist(),
+        _stripped(df, description_col),
+        _stripped(df, "notes"),
+        _stripped(df, "source_doc"),
+        _stripped(df, "program"),
+        _stripped(df, "associated_specs"),
+        _stripped(df, "sft_steps"),
+    ):
+        # Lookup substrate_id and finish_applied_id by (code, program)
+        substrate_id = substrate_ids.get((substrate_code.strip(), program))
+        if substrate_id is None:
             raise ValueError(
-                f"Substrate code '{row['substrate_code']}' for program '{program}' not found for finish_code '{row['finish_code']}'"
+                f"Substrate code '{substrate_code}' for program '{program}' "
+                f"not found for finish_code '{finish_code}'"
             )
-        substrate_id = substrate_result[0]
 
-        # Lookup finish_applied_id by (code, program)
-        cursor.execute("SELECT id FROM finish_applied WHERE code = ? AND program = ?",
-                      (row["finish_applied_code"].strip(), program))
-        fa_result = cursor.fetchone()
-        if not fa_result:
+        fa_id = finish_applied_ids.get((fa_code.strip(), program))
+        if fa_id is None:
             raise ValueError(
-                f"Finish applied code '{row['finish_applied_code']}' for program '{program}' not found for finish_code '{row['finish_code']}'"
+                f"Finish applied code '{fa_code}' for program '{program}' "
+                f"not found for finish_code '{finish_code}'"
             )
-        fa_id = fa_result[0]
-
-        # Handle description - support both 'description' and 'finish_code_description'
-        description = ""
-        if "description" in df.columns:
-            description = row.get("description", "").strip()
-        elif "finish_code_description" in df.columns:
-            description = row.get("finish_code_description", "").strip()
-
-        notes = row.get("notes", "").strip() if "notes" in df.columns else ""
-        source_doc = row.get("source_doc", "").strip() if "source_doc" in df.columns else ""
-        # program already extracted at line 204
-        associated_specs = row.get("associated_specs", "").strip() if "associated_specs" in df.columns else ""
-
-        # Convert seq_id to int, stripping any whitespace
-        seq_id = str(row["seq_id"]).strip()
-        if not seq_id.isdigit():
-            seq_id = "0"
-        seq_id = int(seq_id)
-
-        cursor.execute("""
-            INSERT INTO finish_codes (code, substrate_id, finish_applied_id, seq_id, description, notes, source_doc, program, associated_specs)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(code, program) DO UPDATE SET
-                substrate_id = excluded.substrate_id,
-                finish_applied_id = excluded.finish_applied_id,
-                seq_id = excluded.seq_id,
-                description = excluded.description,
-                notes = excluded.notes,
-                source_doc = excluded.source_doc,
-                associated_specs = excluded.associated_specs
-        """, (row["finish_code"].strip(), substrate_id, fa_id, seq_id, description, notes, source_doc, program, associated_specs))
 
-        # Parse sft_steps if present
-        if "sft_steps" in df.columns and row["sft_steps"]:
-            sft_steps_str = str(row["sft_steps"]).strip()
-            if sft_steps_str and sft_steps_str != "[]":
-                sft_steps_data.append((row["finish_code"].strip(), sft_steps_str))
+        params.append((
+            finish_code, substrate_id, fa_id, seq_id, description, notes, source_doc, program,
+            associated_specs,
+        ))
 
-    conn.commit()
+        # Parse sft_steps if present
+        if sft_steps and sft_steps != "[]":
+            sft_steps_data.append((finish_code, sft_steps))
+
+    conn.executemany("""
+        INSERT INTO finish_codes (code, substrate_id, finish_applied_id, seq_id, description,
+                                  notes, source_doc, program, associated_specs)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(code, program) DO UPDATE SET
+            substrate_id = excluded.substrate_id,
+            finish_applied_id = excluded.finish_applied_id,
+            seq_id = excluded.seq_id,
+            description = excluded.description,
+            notes = excluded.notes,
+            source_doc = excluded.source_doc,
+            associated_specs = excluded.associated_specs
+    """, params)
 
     # Now process sft_steps mappings
-    if sft_steps_data:
-        _load_sft_steps_from_embedded_array(sft_steps_data, conn)
+    if link_now and sft_steps_data:
+        load_finish_code_sft_step_links(sft_steps_data, conn)
 
     return len(df)
 
 
-def _load_sft_steps_from_embedded_array(sft_steps_data: list[tuple[str, str]], conn: sqlite3.Connection):
+def _parse_sft_list(sft_steps_str: str) -> list[str]:
+    """
+    Parse one embedded SFT steps array into its list of codes.
+
+    Handles both proper JSON and Python-style arrays. Entries come back as
+    stripped strings; blanks are kept so they still take up a position in
+    the step order.
+    """
+    if _SFT_BARE_ARRAY_RE.fullmatch(sft_steps_str):
+        return _SFT_CODE_RE.findall(sft_steps_str)
+
+    # Try JSON parsing first
+    try:
+        sft_codes = json.loads(sft_steps_str)
+    except json.JSONDecodeError:
+        # Fallback: manual parsing
+        # Remove brackets and quotes, split by comma
+        clean_str = _SFT_ARRAY_PUNCT_RE.sub('', sft_steps_str)
+        sft_codes = [code.strip() for code in clean_str.split(',') if code.strip()]
+
+    if not sft_codes:
+        return []
+    return [str(sft_code).strip() for sft_code in sft_codes]
+
+
+def load_finish_code_sft_step_links(
+    sft_steps_data: list[tuple[str, str]], conn: sqlite3.Connection
+) -> int:
     """
     Parse embedded SFT steps arrays and load into finish_code_steps table.
 
+    Both finish_codes and sft_steps must already be loaded; entries naming
+    an unknown finish code are skipped, unknown SFT codes are warned about.
+
     Args:
         sft_steps_data: List of (finish_code, sft_steps_json_string) tuples
         conn: SQLite connection
-    """
-    import json
-    import re
-
-    cursor = conn.cursor()
-
-    for finish_code, sft_steps_str in sft_steps_data:
-        # Parse the array - handle both proper JSON and Python-style arrays
-        # Clean up the string: remove brackets, split by comma
-        sft_steps_str = sft_steps_str.strip()
-
-        # Try JSON parsing first
-        sft_codes = []
-        try:
-            sft_codes = json.loads(sft_steps_str)
-        except json.JSONDecodeError:
-            # Fallback: manual parsing
-            # Remove brackets and quotes, split by comma
-            clean_str = re.sub(r'[\[\]\"\']', '', sft_steps_str)
-            sft_codes = [code.strip() for code in clean_str.split(',') if code.strip()]
-
-        if not sft_codes:
-            continue
-
-        # Get finish_code_id
-        cursor.execute("SELECT id FROM finish_codes WHERE code = ?", (finish_code,))
-        fc_result = cursor.fetchone()
-        if not fc_result:
-            continue  # Skip if finish code not found
-        fc_id = fc_result[0]
-
-        # Insert each SFT step with order
-        for step_order, sft_code in enumerate(sft_codes, start=1):
-            sft_code = str(sft_code).strip()
-            if not sft_code:
-                continue
-
-            # Lookup SFT step ID
-            cursor.execute("SELECT id FROM sft_steps WHERE sft_code = ?", (sft_code,))
-            sft_result = cursor.fetchone()
-            if not sft_result:
-                print(f"Warning: SFT code '{sft_code}' not found for finish_code '{finish_code}' - skipping")
-                continue
-            sft_id = sft_result[0]
-
-            # Insert the mapping
-            cursor.execute("""
-                INSERT INTO finish_code_steps (finish_code_id, sft_id, step_order)
-                VALUES (?, ?, ?)
-                ON CONFLICT(finish_code_id, sft_id) DO UPDATE SET
-                    step_order = excluded.step_order
-            """, (fc_id, sft_id, step_order))
 
-    conn.commit()
+    Returns:
+        Number of finish_code_steps rows written
+    """
+    finish_code_ids = _id_lookup(conn, "finish_codes", "code")
+    sft_ids = _id_lookup(conn, "sft_steps", "sft_code")
+
+    # Skip finish codes that were not found
+    steps = pd.DataFrame(sft_steps_data, columns=["finish_code", "sft_steps"])
+    steps["finish_code_id"] = steps["finish_code"].map(finish_code_ids)
+    steps = steps[steps["finish_code_id"].notna()]
+
+    # One row per (finish code, array entry); step_order is the entry's
+    # 1-based position, counted before blanks and unknown codes are dropped
+    steps["sft_code"] = steps["sft_steps"].str.strip().map(_parse_sft_list)
+    steps = steps[steps["sft_code"].str.len() > 0].explode("sft_code")
+    steps["step_order"] = steps.groupby(level=0).cumcount() + 1
+    steps = steps[steps["sft_code"] != ""]
+
+    steps["sft_id"] = steps["sft_code"].map(sft_ids)
+    missing = steps.loc[steps["sft_id"].isna(), ["finish_code", "sft_code"]]
+    for finish_code, sft_code in missing.itertuples(index=False, name=None):
+        print(f"Warning: SFT code '{sft_code}' not found for finish_code '{finish_code}' "
+              "- skipping")
+    steps = steps[steps["sft_id"].notna()]
+
+    # Insert the mappings
+    conn.executemany("""
+        INSERT INTO finish_code_steps (finish_code_id, sft_id, step_order)
+        VALUES (?, ?, ?)
+        ON CONFLICT(finish_code_id, sft_id) DO UPDATE SET
+            step_order = excluded.step_order
+    """, zip(
+        steps["finish_code_id"].astype(int).tolist(),
+        steps["sft_id"].astype(int).tolist(),
+        steps["step_order"].tolist(),
+    ))
+    return len(steps)
 
 
 def load_sft_steps(csv_path: str, conn: sqlite3.Connection) -> int:
@@ -345,44 +552,64 @@ def load_sft_steps(csv_path: str, conn: sqlite3.Connection) -> int:
     Returns:
         Number of rows loaded
     """
-    df = pd.read_csv(csv_path, dtype=str)
-    df = df.fillna("")
+    df = _read_text_csv(csv_path)
 
     required_cols = ["sft_code", "description"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
+    # Optional columns are stored as NULL when absent or empty
+    params = zip(
+        _stripped(df, "sft_code"),
+        _or_none(_stripped(df, "parent_group")),
+        _stripped(df, "description"),
+        _or_none(_stripped(df, "associated_specs")),
+        _or_none(_stripped(df, "source_doc")),
+        _or_none(_stripped(df, "last_review")),
+        _or_none(_stripped(df, "notes")),
+    )
+    conn.executemany("""
+        INSERT INTO sft_steps (sft_code, parent_group, description, associated_specs,
+                               source_doc, last_review, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(sft_code) DO UPDATE SET
+            parent_group = excluded.parent_group,
+            description = excluded.description,
+            associated_specs = excluded.associated_specs,
+            source_doc = excluded.source_doc,
+            last_review = excluded.last_review,
+            notes = excluded.notes
+    """, params)
+
+    rebuild_sft_specs(conn)
+    return len(df)
+
+
+def rebuild_sft_specs(conn: sqlite3.Connection) -> int:
+    """
+    Rebuild sft_specs from sft_steps.associated_specs.
+
+    Each comma-separated spec becomes one row, so queries join on specs
+    instead of re-splitting the grouped string on every read.
+
+    Args:
+        conn: SQLite connection
+
+    Returns:
+        Number of sft_specs rows written
+    """
     cursor = conn.cursor()
-    for _, row in df.iterrows():
-        parent_group = row.get("parent_group", "").strip() if "parent_group" in df.columns else None
-        associated_specs = row.get("associated_specs", "").strip() if "associated_specs" in df.columns else None
-        source_doc = row.get("source_doc", "").strip() if "source_doc" in df.columns else None
-        last_review = row.get("last_review", "").strip() if "last_review" in df.columns else None
-        notes = row.get("notes", "").strip() if "notes" in df.columns else None
-
-        cursor.execute("""
-            INSERT INTO sft_steps (sft_code, parent_group, description, associated_specs, source_doc, last_review, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(sft_code) DO UPDATE SET
-                parent_group = excluded.parent_group,
-                description = excluded.description,
-                associated_specs = excluded.associated_specs,
-                source_doc = excluded.source_doc,
-                last_review = excluded.last_review,
-                notes = excluded.notes
-        """, (
-            row["sft_code"].strip(),
-            parent_group or None,
-            row["description"].strip(),
-            associated_specs or None,
-            source_doc or None,
-            last_review or None,
-            notes or None
-        ))
+    cursor.execute("SELECT id, associated_specs FROM sft_steps WHERE associated_specs IS NOT NULL")
 
-    conn.commit()
-    return len(df)
+    rows = []
+    for sft_id, associated_specs in cursor.fetchall():
+        specs = [s.strip() for s in associated_specs.split(",") if s.strip()]
+        rows.extend((sft_id, position, spec) for position, spec in enumerate(specs))
+
+    cursor.execute("DELETE FROM sft_specs")
+    cursor.executemany("INSERT INTO sft_specs (sft_id, position, spec) VALUES (?, ?, ?)", rows)
+    return len(rows)
 
 
 def load_finish_code_steps(csv_path: str, conn: sqlite3.Connection) -> int:
@@ -406,30 +633,29 @@ def load_finish_code_steps(csv_path: str, conn: sqlite3.Connection) -> int:
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        # Lookup finish_code_id
-        cursor.execute("SELECT id FROM finish_codes WHERE code = ?", (row["finish_code"].strip(),))
-        fc_result = cursor.fetchone()
-        if not fc_result:
-            raise ValueError(f"Finish code '{row['finish_code']}' not found")
-        fc_id = fc_result[0]
-
-        # Lookup sft_id
-        cursor.execute("SELECT id FROM sft_steps WHERE sft_code = ?", (row["sft_code"].strip(),))
-        sft_result = cursor.fetchone()
-        if not sft_result:
-            raise ValueError(f"SFT code '{row['sft_code']}' not found")
-        sft_id = sft_result[0]
-
-        cursor.execute("""
-            INSERT INTO finish_code_steps (finish_code_id, sft_id, step_order)
-            VALUES (?, ?, ?)
-            ON CONFLICT(finish_code_id, sft_id) DO UPDATE SET
-                step_order = excluded.step_order
-        """, (fc_id, sft_id, int(row["step_order"])))
-
-    conn.commit()
+    finish_code_ids = _id_lookup(conn, "finish_codes", "code")
+    sft_ids = _id_lookup(conn, "sft_steps", "sft_code")
+
+    params = []
+    for finish_code, sft_code, step_order in zip(
+        df["finish_code"], df["sft_code"], df["step_order"]
+    ):
+        fc_id = finish_code_ids.get(finish_code.strip())
+        if fc_id is None:
+            raise ValueError(f"Finish code '{finish_code}' not found")
+
+        sft_id = sft_ids.get(sft_code.strip())
+        if sft_id is None:
+            raise ValueError(f"SFT code '{sft_code}' not found")
+
+        params.append((fc_id, sft_id, int(step_order)))
+
+    conn.executemany("""
+        INSERT INTO finish_code_steps (finish_code_id, sft_id, step_order)
+        VALUES (?, ?, ?)
+        ON CONFLICT(finish_code_id, sft_id) DO UPDATE SET
+            step_order = excluded.step_order
+    """, params)
     return len(df)
 
 
@@ -446,31 +672,26 @@ def load_materials(csv_path: str, conn: sqlite3.Connection) -> int:
     Returns:
         Number of rows loaded
     """
-    df = pd.read_csv(csv_path, dtype=str)
-    df = df.fillna("")
+    df = _read_text_csv(csv_path)
 
     required_cols = ["base_spec"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        variant = row.get("variant", "").strip() if "variant" in df.columns else ""
-        variant = variant if variant else None  # Convert empty string to NULL
-
-        description = row.get("description", "").strip() if "description" in df.columns else ""
-        notes = row.get("notes", "").strip() if "notes" in df.columns else ""
-
-        cursor.execute("""
-            INSERT INTO materials (base_spec, variant, description, notes)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(base_spec, variant) DO UPDATE SET
-                description = excluded.description,
-                notes = excluded.notes
-        """, (row["base_spec"].strip(), variant, description, notes))
-
-    conn.commit()
+    params = zip(
+        _stripped(df, "base_spec"),
+        _or_none(_stripped(df, "variant")),  # Convert empty string to NULL
+        _stripped(df, "description"),
+        _stripped(df, "notes"),
+    )
+    conn.executemany("""
+        INSERT INTO materials (base_spec, variant, description, notes)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(base_spec, variant) DO UPDATE SET
+            description = excluded.description,
+            notes = excluded.notes
+    """, params)
     return len(df)
 
 
@@ -487,47 +708,36 @@ def load_sft_material_links(csv_path: str, conn: sqlite3.Connection) -> int:
     Returns:
         Number of rows loaded
     """
-    df = pd.read_csv(csv_path, dtype=str)
-    df = df.fillna("")
+    df = _read_text_csv(csv_path)
 
     required_cols = ["sft_code", "base_spec"]
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        # Lookup sft_id
-        cursor.execute("SELECT id FROM sft_steps WHERE sft_code = ?", (row["sft_code"].strip(),))
-        sft_result = cursor.fetchone()
-        if not sft_result:
-            raise ValueError(f"SFT code '{row['sft_code']}' not found")
-        sft_id = sft_result[0]
-
-        # Lookup material_id
-        variant = row.get("variant", "").strip() if "variant" in df.columns else ""
-        variant = variant if variant else None
-
-        cursor.execute(
-            "SELECT id FROM materials WHERE base_spec = ? AND (variant = ? OR (variant IS NULL AND ? IS NULL))",
-            (row["base_spec"].strip(), variant, variant)
-        )
-        mat_result = cursor.fetchone()
-        if not mat_result:
-            raise ValueError(
-                f"Material '{row['base_spec']} {variant or ''}' not found for SFT '{row['sft_code']}'"
-            )
+    sft_ids = _id_lookup(conn, "sft_steps", "sft_code")
+    material_ids = _id_lookup(conn, "materials", "base_spec", "variant")
 
-        mat_id = mat_result[0]
+    params = []
+    for sft_code, base_spec, variant, note in zip(
+        df["sft_code"], df["base_spec"], _or_none(_stripped(df, "variant")), _stripped(df, "note")
+    ):
+        sft_id = sft_ids.get(sft_code.strip())
+        if sft_id is None:
+            raise ValueError(f"SFT code '{sft_code}' not found")
 
-        note = row.get("note", "").strip() if "note" in df.columns else ""
+        mat_id = material_ids.get((base_spec.strip(), variant))
+        if mat_id is None:
+            raise ValueError(
+                f"Material '{base_spec} {variant or ''}' not found for SFT '{sft_code}'"
+            )
 
-        cursor.execute("""
-            INSERT INTO sft_material_links (sft_id, material_id, note)
-            VALUES (?, ?, ?)
-        """, (sft_id, mat_id, note or None))
+        params.append((sft_id, mat_id, note or None))
 
-    conn.commit()
+    conn.executemany("""
+        INSERT INTO sft_material_links (sft_id, material_id, note)
+        VALUES (?, ?, ?)
+    """, params)
     return len(df)
 
 
@@ -552,37 +762,33 @@ def load_chemicals(csv_path: str, conn: sqlite3.Connection) -> int:
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        cas = row.get("cas", "").strip() if "cas" in df.columns else ""
-        cas = cas if cas else None
-
-        hazard_flags = row.get("hazard_flags", "").strip() if "hazard_flags" in df.columns else ""
-        hazard_flags = hazard_flags if hazard_flags else None
+    names = df["name"]
+    hazard_flags = _or_none(_stripped(df, "hazard_flags"))
 
-        # Validate JSON if present
-        if hazard_flags:
+    # Validate JSON if present
+    for name, flags in zip(names, hazard_flags):
+        if flags:
             try:
-                json.loads(hazard_flags)
+                json.loads(flags)
             except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in hazard_flags for chemical '{row['name']}': {e}")
-
-        hazard_level = row.get("default_hazard_level") if "default_hazard_level" in df.columns else None
-        if pd.notna(hazard_level):
-            hazard_level = int(hazard_level)
-        else:
-            hazard_level = None
-
-        cursor.execute("""
-            INSERT INTO chemicals (name, cas, hazard_flags, default_hazard_level)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(cas) DO UPDATE SET
-                name = excluded.name,
-                hazard_flags = excluded.hazard_flags,
-                default_hazard_level = excluded.default_hazard_level
-        """, (row["name"].strip(), cas, hazard_flags, hazard_level))
+                raise ValueError(f"Invalid JSON in hazard_flags for chemical '{name}': {e}")
 
-    conn.commit()
+    if "default_hazard_level" in df.columns:
+        hazard_levels = [
+            int(level) if pd.notna(level) else None for level in df["default_hazard_level"]
+        ]
+    else:
+        hazard_levels = [None] * len(df)
+
+    params = zip(names.str.strip(), _or_none(_stripped(df, "cas")), hazard_flags, hazard_levels)
+    conn.executemany("""
+        INSERT INTO chemicals (name, cas, hazard_flags, default_hazard_level)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(cas) DO UPDATE SET
+            name = excluded.name,
+            hazard_flags = excluded.hazard_flags,
+            default_hazard_level = excluded.default_hazard_level
+    """, params)
     return len(df)
 
 
@@ -607,46 +813,44 @@ def load_material_chemicals(csv_path: str, conn: sqlite3.Connection) -> int:
     if missing_cols:
         raise ValueError(f"Missing required columns in {csv_path}: {missing_cols}")
 
-    cursor = conn.cursor()
-    for _, row in df.iterrows():
-        # Lookup material_id
-        variant = row.get("variant", "").strip() if "variant" in df.columns else ""
-        variant = variant if variant else None
-
-        cursor.execute(
-            "SELECT id FROM materials WHERE base_spec = ? AND (variant = ? OR (variant IS NULL AND ? IS NULL))",
-            (row["base_spec"].strip(), variant, variant)
-        )
-        mat_result = cursor.fetchone()
-        if not mat_result:
-            raise ValueError(f"Material '{row['base_spec']} {variant or ''}' not found")
-        mat_id = mat_result[0]
+    material_ids = _id_lookup(conn, "materials", "base_spec", "variant")
+    chemical_ids = _id_lookup(conn, "chemicals", "cas")
+
+    pct_lows = df["pct_wt_low"] if "pct_wt_low" in df.columns else [None] * len(df)
+    pct_highs = df["pct_wt_high"] if "pct_wt_high" in df.columns else [None] * len(df)
+
+    params = []
+    for base_spec, variant, cas, pct_low, pct_high, notes in zip(
+        df["base_spec"], _or_none(_stripped(df, "variant")), df["cas"],
+        pct_lows, pct_highs, _stripped(df, "notes"),
+    ):
+        mat_id = material_ids.get((base_spec.strip(), variant))
+        if mat_id is None:
+            raise ValueError(f"Material '{base_spec} {variant or ''}' not found")
 
         # Lookup chemical_id by CAS
-        cursor.execute("SELECT id FROM chemicals WHERE cas = ?", (row["cas"].strip(),))
-        chem_result = cursor.fetchone()
-        if not chem_result:
-            raise ValueError(f"Chemical with CAS '{row['cas']}' not found")
-        chem_id = chem_result[0]
+        chem_id = chemical_ids.get(cas.strip())
+        if chem_id is None:
+            raise ValueError(f"Chemical with CAS '{cas}' not found")
 
-        pct_low = row.get("pct_wt_low") if "pct_wt_low" in df.columns else None
         pct_low = float(pct_low) if pd.notna(pct_low) else None
-
-        pct_high = row.get("pct_wt_high") if "pct_wt_high" in df.columns else None
         pct_high = float(pct_high) if pd.notna(pct_high) else None
 
-        notes = row.get("notes", "").strip() if "notes" in df.columns else ""
-
-        cursor.execute("""
-            INSERT INTO material_chemicals (material_id, chemical_id, pct_wt_low, pct_wt_high, notes)
-            VALUES (?, ?, ?, ?, ?)
-        """, (mat_id, chem_id, pct_low, pct_high, notes or None))
+        params.append((mat_id, chem_id, pct_low, pct_high, notes or None))
 
-    conn.commit()
+    conn.executemany("""
+        INSERT INTO material_chemicals (material_id, chemical_id, pct_wt_low, pct_wt_high, notes)
+        VALUES (?, ?, ?, ?, ?)
+    """, params)
     return len(df)
 
 
-def ingest_all(input_dir: str, db_path: str, schema_path: str = "db/schema.sql") -> dict[str, Any]:
+def ingest_all(
+    input_dir: str,
+    db_path: str,
+    schema_path: str = "db/schema.sql",
+    fast_bulk_load: bool = True
+) -> dict[str, Any]:
     """
     Orchestrate full CSV ingestion into SQLite database.
 
@@ -656,6 +860,8 @@ def ingest_all(input_dir: str, db_path: str, schema_path: str = "db/schema.sql")
         input_dir: Directory containing CSV files
         db_path: Path to SQLite database
         schema_path: Path to schema.sql file
+        fast_bulk_load: Drop secondary indexes for the load and rebuild them
+            afterwards (same transaction) instead of updating them per row
 
     Returns:
         Ingestion report dictionary with:
@@ -666,24 +872,35 @@ def ingest_all(input_dir: str, db_path: str, schema_path: str = "db/schema.sql")
 
     Raises:
         FileNotFoundError: If input_dir or required CSV not found
-        ValueError: If CSV validation fails
+        ValueError: If CSV validation fails or HAZARD_HASH_ALGO or
+            HAZARD_CSV_ENGINE is invalid
         sqlite3.Error: If database operations fail
     """
     input_path = Path(input_dir)
     if not input_path.exists():
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
-    # Initialize database
+    hash_algo = get_hash_algo()
+    get_csv_engine()  # Reject a bad HAZARD_CSV_ENGINE before touching the database
+
+    # Initialize database; every loader below writes into one transaction
     conn = initialize_database(db_path, schema_path)
+    _set_fast_pragmas(conn)
+    conn.execute("BEGIN")
+    dropped_indexes = _drop_secondary_indexes(conn) if fast_bulk_load else []
 
     loaded_files = {}
     errors = []
 
+    # finish_codes.csv loads before sft_steps.csv, so its embedded sft_steps
+    # arrays are collected here and linked once the SFT codes are in
+    embedded_sft_steps: list[tuple[str, str]] = []
+
     # Define load order (parent tables first)
     load_sequence = [
         ("substrates.csv", load_substrates),
         ("finish_applied.csv", load_finish_applied),
-        ("finish_codes.csv", load_finish_codes),
+        ("finish_codes.csv", partial(load_finish_codes, sft_steps_data=embedded_sft_steps)),
         ("sft_steps.csv", load_sft_steps),
         ("finish_code_steps.csv", load_finish_code_steps),
         ("materials_map.csv", load_materials),
@@ -692,46 +909,87 @@ def ingest_all(input_dir: str, db_path: str, schema_path: str = "db/schema.sql")
         ("material_chemicals.csv", load_material_chemicals),
     ]
 
-    for filename, load_func in load_sequence:
-        csv_path = input_path / filename
-        if not csv_path.exists():
-            errors.append({
-                "file": filename,
-                "error": "File not found",
-                "severity": "error"
-            })
-            continue
-
-        try:
-            # Compute SHA256
-            sha256 = compute_sha256(csv_path)
-
-            # Load CSV
-            rows_loaded = load_func(str(csv_path), conn)
-
-            # Record metadata
-            record_metadata(conn, filename, sha256, rows_loaded)
-
-            loaded_files[filename] = {
-                "rows": rows_loaded,
-                "sha256": sha256
-            }
-
-        except Exception as e:
-            errors.append({
-                "file": filename,
-                "error": str(e),
-                "severity": "error"
-            })
-
-    # Run validation
-    validation_report = validate_all(conn)
+    # Hash every input up front on a small pool (hashlib releases the GIL),
+    # so digests overlap each other and the first loads. Errors surface from
+    # .result() inside the per-file try below, as before.
+    hasher = ThreadPoolExecutor(max_workers=4)
+    sha_futures = {
+        filename: hasher.submit(compute_content_hash, input_path / filename, hash_algo)
+        for filename, _ in load_sequence
+        if (input_path / filename).exists()
+    }
+    hasher.shutdown(wait=False)
 
+    try:
+        for filename, load_func in load_sequence:
+            csv_path = input_path / filename
+            if filename not in sha_futures:
+                errors.append({
+                    "file": filename,
+                    "error": "File not found",
+                    "severity": "error"
+                })
+            else:
+                try:
+                    # Content hash computed above
+                    sha256 = sha_futures[filename].result()
+
+                    # Load CSV
+                    rows_loaded = load_func(str(csv_path), conn)
+
+                    # Record metadata
+                    record_metadata(conn, filename, sha256, rows_loaded, hash_algo)
+
+                    loaded_files[filename] = {
+                        "rows": rows_loaded,
+                        "sha256": sha256,
+                        "hash_algo": hash_algo
+                    }
+
+                except Exception as e:
+                    errors.append({
+                        "file": filename,
+                        "error": str(e),
+                        "severity": "error"
+                    })
+
+            # Link the embedded arrays ahead of finish_code_steps.csv, which
+            # may override their step order
+            if filename == "sft_steps.csv" and embedded_sft_steps:
+                try:
+                    load_finish_code_sft_step_links(embedded_sft_steps, conn)
+                except Exception as e:
+                    errors.append({
+                        "file": "finish_codes.csv",
+                        "error": f"Embedded sft_steps: {e}",
+                        "severity": "error"
+                    })
+    finally:
+        # Put dropped indexes back even if a load escapes the per-file handler
+        _restore_indexes(conn, dropped_indexes)
+
+    # Commit the load, then validate the committed data on a read-only
+    # connection while the writer refreshes planner statistics; WAL keeps
+    # the two from blocking each other. synchronous goes back to NORMAL so
+    # the checkpoint on close syncs everything to disk.
+    conn.commit()
+    conn.execute("PRAGMA synchronous = NORMAL")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        validation = executor.submit(_validate_readonly, db_path)
+        conn.execute("ANALYZE")
+        validation_report = validation.result()
+
+    # SQLite's recommended last step before closing a connection that wrote
+    # data; nearly free right after the full ANALYZE above
+    conn.execute("PRAGMA optimize")
     conn.close()
 
     # Determine overall status
+    # Count files that did not load, not error entries: a failed embedded
+    # link adds an error for finish_codes.csv even when that file loaded
     if errors:
-        status = "failed" if len(errors) == len(load_sequence) else "partial"
+        failed_files = {error["file"] for error in errors} - loaded_files.keys()
+        status = "failed" if len(failed_files) == len(load_sequence) else "partial"
     elif validation_report["status"] == "errors":
         status = "failed"
     elif validation_report["status"] == "warnings":
@@ -744,5 +1002,5 @@ def ingest_all(input_dir: str, db_path: str, schema_path: str = "db/schema.sql")
         "loaded_files": loaded_files,
         "validation_report": validation_report,
         "errors": errors,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _utc_now_iso()
     }
@@ -10,15 +10,152 @@ Validates database contents after CSV ingestion to ensure:
 import json
 import re
 import sqlite3
-from typing import Any
+from typing import Any, Optional
+
+# CAS format: NNNNNN-NN-N or NNNNN-NN-N (4-7 leading digits)
+_CAS_RE = re.compile(r'^\d{4,7}-\d{2}-\d$')
+
+# FK relationships checked by validate_referential_integrity:
+# (child table, child column, parent table, parent column)
+_FK_CHECKS = (
+    ("finish_codes", "substrate_id", "substrates", "id"),
+    ("finish_codes", "finish_applied_id", "finish_applied", "id"),
+    ("finish_code_steps", "finish_code_id", "finish_codes", "id"),
+    ("finish_code_steps", "sft_id", "sft_steps", "id"),
+    ("sft_specs", "sft_id", "sft_steps", "id"),
+    ("sft_material_links", "sft_id", "sft_steps", "id"),
+    ("sft_material_links", "material_id", "materials", "id"),
+    ("material_chemicals", "material_id", "materials", "id"),
+    ("material_chemicals", "chemical_id", "chemicals", "id"),
+    ("spec_dependencies", "spec_material_id", "materials", "id"),
+    ("spec_dependencies", "ref_spec_material_id", "materials", "id"),
+)
+
+# Orphan count for each FK check, tagged with its index in _FK_CHECKS. Built
+# once, so a given set of probes always joins into the same SQL text and
+# repeated runs on a connection reuse its cached prepared statement.
+# The child column is grouped (an index scan) so each distinct value is
+# looked up in the parent key index once, then anti-joined rather than
+# materializing a NOT IN list.
+_ORPHAN_PROBES = tuple(
+    f"""
+            SELECT {i} as probe,
+                   COALESCE(SUM(d.row_count), 0) as orphan_count,
+                   COUNT(*) as orphan_values
+            FROM (
+                SELECT {child_col} as fk, COUNT(*) as row_count
+                FROM {child_table}
+                WHERE {child_col} IS NOT NULL
+                GROUP BY {child_col}
+            ) d
+            LEFT JOIN {parent_table} p ON d.fk = p.{parent_col}
+            WHERE p.{parent_col} IS NULL
+        """
+    for i, (child_table, child_col, parent_table, parent_col) in enumerate(_FK_CHECKS)
+)
+
+# Scan tuning for validate_all: 64 MB page cache, 256 MB mmap, in-memory temp B-trees
+_SCAN_CACHE_KIB = 65536
+_SCAN_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _existing_tables(conn: sqlite3.Connection) -> set[str]:
+    """Return the names of all tables in the database (one sqlite_master scan)."""
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
 
+def _has_rows(conn: sqlite3.Connection, table: str) -> bool:
+    """Return True if table has at least one row (stops at the first)."""
+    return bool(conn.execute(f"SELECT EXISTS(SELECT 1 FROM {table})").fetchone()[0])
 
-def validate_referential_integrity(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+
+def _fk_violation_counts(
+    conn: sqlite3.Connection, child_table: str
+) -> Optional[dict[tuple[str, str, str], int]]:
+    """
+    Count PRAGMA foreign_key_check violations for each FK declared on child_table.
+
+    Returns:
+        Violation count keyed by (child column, parent table, parent column),
+        all lower-cased, for every single-column FK naming its parent column;
+        None if SQLite cannot check the table (e.g. a "foreign key mismatch")
+    """
+    declared = {}
+    composite = set()
+    for fk_id, seq, parent_table, child_col, parent_col, *_ in conn.execute(
+        f"PRAGMA foreign_key_list({child_table})"
+    ):
+        if seq > 0:
+            composite.add(fk_id)
+        elif parent_col is not None:
+            declared[fk_id] = (child_col.lower(), parent_table.lower(), parent_col.lower())
+    for fk_id in composite:
+        declared.pop(fk_id, None)
+
+    counts = dict.fromkeys(declared.values(), 0)
+    try:
+        violations = conn.execute(f"PRAGMA foreign_key_check({child_table})")
+        for _table, _rowid, _parent, fk_id in violations:
+            if fk_id in declared:
+                counts[declared[fk_id]] += 1
+    except sqlite3.OperationalError:
+        return None
+    return counts
+
+
+def _tune_for_scans(conn: sqlite3.Connection) -> dict[str, int]:
+    """
+    Make conn query-only and give it room for repeated table scans.
+
+    The cache and mmap sizes are only ever raised, so a connection that is
+    already tuned more generously (e.g. the CLI's pooled one) keeps its own.
+    temp_store is left alone: changing it drops the connection's TEMP
+    tables, so callers that open a connection just for validation set it.
+
+    Returns:
+        Previous values of the pragmas changed, for _restore_pragmas()
+    """
+    previous = {}
+
+    def pragma(name: str) -> Optional[int]:
+        row = conn.execute(f"PRAGMA {name}").fetchone()
+        return row[0] if row else None
+
+    previous["query_only"] = pragma("query_only")
+    conn.execute("PRAGMA query_only = 1")
+
+    # cache_size is KiB when negative, pages when positive
+    cache_size = pragma("cache_size")
+    cache_kib = -cache_size if cache_size < 0 else cache_size * pragma("page_size") // 1024
+    if cache_kib < _SCAN_CACHE_KIB:
+        previous["cache_size"] = cache_size
+        conn.execute(f"PRAGMA cache_size = -{_SCAN_CACHE_KIB}")
+
+    # No row for in-memory databases, which have nothing to map
+    mmap_size = pragma("mmap_size")
+    if mmap_size is not None and mmap_size < _SCAN_MMAP_SIZE:
+        previous["mmap_size"] = mmap_size
+        conn.execute(f"PRAGMA mmap_size = {_SCAN_MMAP_SIZE}")
+
+    return previous
+
+
+def _restore_pragmas(conn: sqlite3.Connection, previous: dict[str, int]) -> None:
+    """Put back pragma values saved by _tune_for_scans()."""
+    for name, value in previous.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def validate_referential_integrity(
+    conn: sqlite3.Connection,
+    existing_tables: Optional[set[str]] = None
+) -> list[dict[str, Any]]:
     """
     Validate all foreign key relationships resolve correctly.
 
     Args:
         conn: SQLite database connection
+        existing_tables: Table names from _existing_tables() (looked up if omitted)
 
     Returns:
         List of error dictionaries with keys: type, table, column, issue, details
@@ -30,41 +167,35 @@ def validate_referential_integrity(conn: sqlite3.Connection) -> list[dict[str, A
             "table": "finish_codes",
             "column": "substrate_id",
             "issue": "orphan_fk",
-            "details": "3 rows reference non-existent substrate_id values"
+            "details": "3 rows reference non-existent substrates.id values (2 distinct)"
         }
     """
     errors = []
     cursor = conn.cursor()
-
-    # Define FK relationships to check
-    fk_checks = [
-        ("finish_codes", "substrate_id", "substrates", "id"),
-        ("finish_codes", "finish_applied_id", "finish_applied", "id"),
-        ("finish_code_steps", "finish_code_id", "finish_codes", "id"),
-        ("finish_code_steps", "sft_id", "sft_steps", "id"),
-        ("sft_material_links", "sft_id", "sft_steps", "id"),
-        ("sft_material_links", "material_id", "materials", "id"),
-        ("material_chemicals", "material_id", "materials", "id"),
-        ("material_chemicals", "chemical_id", "chemicals", "id"),
-        ("spec_dependencies", "spec_material_id", "materials", "id"),
-        ("spec_dependencies", "ref_spec_material_id", "materials", "id"),
-    ]
-
-    for child_table, child_col, parent_table, parent_col in fk_checks:
+    if existing_tables is None:
+        existing_tables = _existing_tables(conn)
+
+    # FKs declared in the schema are screened by SQLite's own checker (one
+    # native pass per child table); only the ones it flags, and any check the
+    # schema does not declare, are counted by the probes below
+    violation_counts = {}
+    for child_table in dict.fromkeys(check[0] for check in _FK_CHECKS):
+        if child_table in existing_tables:
+            violation_counts[child_table] = _fk_violation_counts(conn, child_table) or {}
+
+    # Per check: None (child table missing or no violations), a
+    # missing_parent_table error, or True if the combined query below counts
+    # its orphans
+    outcomes = []
+    probes = []
+    for i, (child_table, child_col, parent_table, parent_col) in enumerate(_FK_CHECKS):
         # Check if tables exist
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (child_table,)
-        )
-        if not cursor.fetchone():
-            continue  # Table doesn't exist yet, skip check
-
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (parent_table,)
-        )
-        if not cursor.fetchone():
-            errors.append({
+        if child_table not in existing_tables:
+            outcomes.append(None)  # Table doesn't exist yet, skip check
+            continue
+
+        if parent_table not in existing_tables:
+            outcomes.append({
                 "type": "referential_integrity",
                 "severity": "error",
                 "table": child_table,
@@ -74,17 +205,30 @@ def validate_referential_integrity(conn: sqlite3.Connection) -> list[dict[str, A
             })
             continue
 
+        declared_key = (child_col.lower(), parent_table.lower(), parent_col.lower())
+        if violation_counts[child_table].get(declared_key) == 0:
+            outcomes.append(None)  # Declared FK with no violations
+            continue
+
         # Find orphaned foreign keys
-        query = f"""
-            SELECT COUNT(*) as orphan_count
-            FROM {child_table}
-            WHERE {child_col} IS NOT NULL
-              AND {child_col} NOT IN (SELECT {parent_col} FROM {parent_table})
-        """
-        cursor.execute(query)
-        result = cursor.fetchone()
-        orphan_count = result[0] if result else 0
+        outcomes.append(True)
+        probes.append(_ORPHAN_PROBES[i])
+
+    # One statement for every orphan count, keyed by check index
+    orphan_counts = {}
+    if probes:
+        cursor.execute(" UNION ALL ".join(probes))
+        orphan_counts = {probe: counts for probe, *counts in cursor}
+
+    for i, (fk_check, outcome) in enumerate(zip(_FK_CHECKS, outcomes)):
+        child_table, child_col, parent_table, parent_col = fk_check
+        if outcome is None:
+            continue
+        if isinstance(outcome, dict):
+            errors.append(outcome)
+            continue
 
+        orphan_count, orphan_values = orphan_counts[i]
         if orphan_count > 0:
             errors.append({
                 "type": "referential_integrity",
@@ -93,17 +237,22 @@ def validate_referential_integrity(conn: sqlite3.Connection) -> list[dict[str, A
                 "column": child_col,
                 "issue": "orphan_fk",
                 "details": f"{orphan_count} rows reference non-existent {parent_table}.{parent_col} values"
+                           f" ({orphan_values} distinct)"
             })
 
     return errors
 
 
-def validate_completeness(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+def validate_completeness(
+    conn: sqlite3.Connection,
+    existing_tables: Optional[set[str]] = None
+) -> list[dict[str, Any]]:
     """
     Validate required fields are populated (no NULLs where NOT NULL expected).
 
     Args:
         conn: SQLite database connection
+        existing_tables: Table names from _existing_tables() (looked up if omitted)
 
     Returns:
         List of error dictionaries
@@ -120,6 +269,8 @@ def validate_completeness(conn: sqlite3.Connection) -> list[dict[str, Any]]:
     """
     errors = []
     cursor = conn.cursor()
+    if existing_tables is None:
+        existing_tables = _existing_tables(conn)
 
     # Define required fields to check (table, column)
     required_fields = [
@@ -133,6 +284,8 @@ def validate_completeness(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         ("finish_codes", "seq_id"),
         ("sft_steps", "sft_code"),
         ("sft_steps", "description"),
+        ("sft_specs", "sft_id"),
+        ("sft_specs", "spec"),
         ("finish_code_steps", "finish_code_id"),
         ("finish_code_steps", "sft_id"),
         ("finish_code_steps", "step_order"),
@@ -144,42 +297,65 @@ def validate_completeness(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         ("material_chemicals", "chemical_id"),
         ("metadata_versions", "source_name"),
         ("metadata_versions", "sha256"),
+        ("metadata_versions", "hash_algo"),
         ("metadata_versions", "rows_loaded"),
     ]
 
+    # Group columns by table (order preserved) so each table is scanned once
+    columns_by_table: dict[str, list[str]] = {}
     for table, column in required_fields:
+        columns_by_table.setdefault(table, []).append(column)
+
+    for table, columns in columns_by_table.items():
         # Check if table exists
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table,)
-        )
-        if not cursor.fetchone():
+        if table not in existing_tables:
             continue  # Table doesn't exist yet, skip
 
-        query = f"SELECT COUNT(*) FROM {table} WHERE {column} IS NULL"
-        cursor.execute(query)
+        # Tables from older schema versions may lack newer columns
+        table_columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        for column in columns:
+            if column not in table_columns:
+                errors.append({
+                    "type": "completeness",
+                    "severity": "error",
+                    "table": table,
+                    "column": column,
+                    "issue": "missing_column",
+                    "details": f"Column '{column}' does not exist (re-run ingest to add it)"
+                })
+        columns = [column for column in columns if column in table_columns]
+        if not columns:
+            continue
+
+        null_sums = ", ".join(f"SUM({column} IS NULL)" for column in columns)
+        cursor.execute(f"SELECT {null_sums} FROM {table}")
         result = cursor.fetchone()
-        null_count = result[0] if result else 0
 
-        if null_count > 0:
-            errors.append({
-                "type": "completeness",
-                "severity": "error",
-                "table": table,
-                "column": column,
-                "issue": "null_value",
-                "details": f"{null_count} rows have NULL {column}"
-            })
+        for column, null_count in zip(columns, result):
+            # SUM() over an empty table is NULL
+            if null_count:
+                errors.append({
+                    "type": "completeness",
+                    "severity": "error",
+                    "table": table,
+                    "column": column,
+                    "issue": "null_value",
+                    "details": f"{null_count} rows have NULL {column}"
+                })
 
     return errors
 
 
-def validate_formats(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+def validate_formats(
+    conn: sqlite3.Connection,
+    existing_tables: Optional[set[str]] = None
+) -> list[dict[str, Any]]:
     """
     Validate data formats (CAS numbers, JSON strings, numeric ranges).
 
     Args:
         conn: SQLite database connection
+        existing_tables: Table names from _existing_tables() (looked up if omitted)
 
     Returns:
         List of error/warning dictionaries
@@ -193,20 +369,49 @@ def validate_formats(conn: sqlite3.Connection) -> list[dict[str, Any]]:
     """
     errors = []
     cursor = conn.cursor()
-
-    # Check CAS number format (if chemicals table exists)
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='chemicals'"
-    )
-    if cursor.fetchone():
-        # CAS format: NNNNNN-NN-N or NNNNN-NN-N (or NULL)
-        cas_pattern = re.compile(r'^\d{4,7}-\d{2}-\d$')
-
-        cursor.execute("SELECT id, name, cas FROM chemicals WHERE cas IS NOT NULL")
-        for row in cursor.fetchall():
-            chem_id, chem_name, cas = row
-            if not cas_pattern.match(cas):
-                errors.append({
+    if existing_tables is None:
+        existing_tables = _existing_tables(conn)
+
+    # Check chemicals formats (if chemicals table exists and has rows). All
+    # three checks share one scan: SQL flags the suspect rows of each kind and
+    # Python confirms and words them, keeping each check's errors together.
+    if "chemicals" in existing_tables and _has_rows(conn, "chemicals"):
+        # ASCII CAS numbers of each allowed length pass in SQL; only the rest
+        # (almost always invalid) are fetched and checked with the regex
+        cas_suspect = """cas IS NOT NULL
+            AND cas NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9]'
+            AND cas NOT GLOB '[0-9][0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9]'
+            AND cas NOT GLOB '[0-9][0-9][0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9]'
+            AND cas NOT GLOB '[0-9][0-9][0-9][0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9]'"""
+        # hazard_flags must be valid JSON. json_valid() screens rows in C so
+        # only suspect ones reach the JSON parser (which still has the final say
+        # and words the error); it stops at NUL, so those rows are always checked.
+        # Without the JSON1 functions every row is checked in Python. The
+        # stdlib parser is used, as in load_chemicals(), so validation accepts
+        # exactly what ingest accepted.
+        json_suspect = """hazard_flags IS NOT NULL
+            AND (json_valid(hazard_flags) = 0 OR instr(hazard_flags, char(0)) > 0)"""
+        # Hazard level range (already enforced by CHECK constraint, but double-check)
+        level_invalid = """default_hazard_level IS NOT NULL
+            AND (default_hazard_level < 1 OR default_hazard_level > 5)"""
+        chemicals_sql = """
+            SELECT id, name, cas, hazard_flags, default_hazard_level,
+                   {cas} AS cas_suspect, {json} AS json_suspect, {level} AS level_invalid
+            FROM chemicals
+            WHERE cas_suspect OR json_suspect OR level_invalid
+        """
+        try:
+            cursor.execute(
+                chemicals_sql.format(cas=cas_suspect, json=json_suspect, level=level_invalid)
+            )
+        except sqlite3.OperationalError:
+            cursor.execute(chemicals_sql.format(cas=cas_suspect, json="hazard_flags IS NOT NULL",
+                                                level=level_invalid))
+
+        cas_errors, json_errors, level_errors = [], [], []
+        for chem_id, chem_name, cas, hazard_flags, level, bad_cas, bad_json, bad_level in cursor:
+            if bad_cas and not _CAS_RE.match(cas):
+                cas_errors.append({
                     "type": "format",
                     "severity": "warning",
                     "table": "chemicals",
@@ -215,104 +420,105 @@ def validate_formats(conn: sqlite3.Connection) -> list[dict[str, Any]]:
                     "details": f"Chemical '{chem_name}' (id={chem_id}) has invalid CAS: '{cas}'"
                 })
 
-        # Check hazard_flags is valid JSON
-        cursor.execute("SELECT id, name, hazard_flags FROM chemicals WHERE hazard_flags IS NOT NULL")
-        for row in cursor.fetchall():
-            chem_id, chem_name, hazard_flags = row
-            try:
-                json.loads(hazard_flags)
-            except json.JSONDecodeError as e:
-                errors.append({
+            if bad_json:
+                try:
+                    json.loads(hazard_flags)
+                except json.JSONDecodeError as e:
+                    json_errors.append({
+                        "type": "format",
+                        "severity": "error",
+                        "table": "chemicals",
+                        "column": "hazard_flags",
+                        "issue": "invalid_json",
+                        "details": (f"Chemical '{chem_name}' (id={chem_id}) "
+                                    f"has invalid JSON hazard_flags: {e}")
+                    })
+
+            if bad_level:
+                level_errors.append({
                     "type": "format",
                     "severity": "error",
                     "table": "chemicals",
-                    "column": "hazard_flags",
-                    "issue": "invalid_json",
-                    "details": f"Chemical '{chem_name}' (id={chem_id}) has invalid JSON hazard_flags: {e}"
+                    "column": "default_hazard_level",
+                    "issue": "out_of_range",
+                    "details": (f"Chemical '{chem_name}' (id={chem_id}) "
+                                f"has invalid hazard level: {level} (must be 1-5)")
                 })
 
-        # Check hazard level range (already enforced by CHECK constraint, but double-check)
-        cursor.execute("""
-            SELECT id, name, default_hazard_level
-            FROM chemicals
-            WHERE default_hazard_level IS NOT NULL
-              AND (default_hazard_level < 1 OR default_hazard_level > 5)
-        """)
-        for row in cursor.fetchall():
-            chem_id, chem_name, level = row
-            errors.append({
-                "type": "format",
-                "severity": "error",
-                "table": "chemicals",
-                "column": "default_hazard_level",
-                "issue": "out_of_range",
-                "details": f"Chemical '{chem_name}' (id={chem_id}) has invalid hazard level: {level} (must be 1-5)"
-            })
+        errors.extend(cas_errors)
+        errors.extend(json_errors)
+        errors.extend(level_errors)
 
     # Check material_chemicals weight ranges
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='material_chemicals'"
-    )
-    if cursor.fetchone():
-        # pct_wt_low <= pct_wt_high (CHECK constraint should prevent, but verify)
+    if "material_chemicals" in existing_tables and _has_rows(conn, "material_chemicals"):
+        # One grouped pass (in material_id index order) tells whether either
+        # check below can find anything; the joined queries only run if so
         cursor.execute("""
-            SELECT mc.id, m.base_spec, m.variant, c.name, mc.pct_wt_low, mc.pct_wt_high
-            FROM material_chemicals mc
-            JOIN materials m ON mc.material_id = m.id
-            JOIN chemicals c ON mc.chemical_id = c.id
-            WHERE mc.pct_wt_low IS NOT NULL
-              AND mc.pct_wt_high IS NOT NULL
-              AND mc.pct_wt_low > mc.pct_wt_high
+            SELECT COALESCE(SUM(bad_ranges), 0), COALESCE(MAX(total_max > 100), 0)
+            FROM (
+                SELECT SUM(pct_wt_low > pct_wt_high) AS bad_ranges, SUM(pct_wt_high) AS total_max
+                FROM material_chemicals
+                GROUP BY material_id
+            )
         """)
-        for row in cursor.fetchall():
-            mc_id, base_spec, variant, chem_name, low, high = row
-            variant_str = variant or ""
-            errors.append({
-                "type": "format",
-                "severity": "error",
-                "table": "material_chemicals",
-                "column": "pct_wt_low, pct_wt_high",
-                "issue": "invalid_range",
-                "details": f"Material '{base_spec} {variant_str}' - Chemical '{chem_name}': "
-                           f"pct_wt_low ({low}) > pct_wt_high ({high})"
-            })
+        any_bad_range, any_over_100 = cursor.fetchone()
+
+        if any_bad_range:
+            # pct_wt_low <= pct_wt_high (CHECK constraint should prevent, but verify)
+            cursor.execute("""
+                SELECT mc.id, m.base_spec, m.variant, c.name, mc.pct_wt_low, mc.pct_wt_high
+                FROM material_chemicals mc
+                JOIN materials m ON mc.material_id = m.id
+                JOIN chemicals c ON mc.chemical_id = c.id
+                WHERE mc.pct_wt_low IS NOT NULL
+                  AND mc.pct_wt_high IS NOT NULL
+                  AND mc.pct_wt_low > mc.pct_wt_high
+            """)
+            for mc_id, base_spec, variant, chem_name, low, high in cursor:
+                variant_str = variant or ""
+                errors.append({
+                    "type": "format",
+                    "severity": "error",
+                    "table": "material_chemicals",
+                    "column": "pct_wt_low, pct_wt_high",
+                    "issue": "invalid_range",
+                    "details": f"Material '{base_spec} {variant_str}' - Chemical '{chem_name}': "
+                               f"pct_wt_low ({low}) > pct_wt_high ({high})"
+                })
 
-        # Warn if total weight exceeds 100% for any material
-        cursor.execute("""
-            SELECT m.id, m.base_spec, m.variant, SUM(mc.pct_wt_high) as total_max
-            FROM materials m
-            JOIN material_chemicals mc ON m.id = mc.material_id
-            WHERE mc.pct_wt_high IS NOT NULL
-            GROUP BY m.id, m.base_spec, m.variant
-            HAVING total_max > 100
-        """)
-        for row in cursor.fetchall():
-            mat_id, base_spec, variant, total = row
-            variant_str = variant or ""
-            errors.append({
-                "type": "format",
-                "severity": "warning",
-                "table": "material_chemicals",
-                "column": "pct_wt_high",
-                "issue": "exceeds_100_percent",
-                "details": f"Material '{base_spec} {variant_str}' has total max weight {total:.1f}% (>100%)"
-            })
+        if any_over_100:
+            # Warn if total weight exceeds 100% for any material
+            cursor.execute("""
+                SELECT m.id, m.base_spec, m.variant, SUM(mc.pct_wt_high) as total_max
+                FROM materials m
+                JOIN material_chemicals mc ON m.id = mc.material_id
+                WHERE mc.pct_wt_high IS NOT NULL
+                GROUP BY m.id, m.base_spec, m.variant
+                HAVING total_max > 100
+            """)
+            for mat_id, base_spec, variant, total in cursor:
+                variant_str = variant or ""
+                errors.append({
+                    "type": "format",
+                    "severity": "warning",
+                    "table": "material_chemicals",
+                    "column": "pct_wt_high",
+                    "issue": "exceeds_100_percent",
+                    "details": (f"Material '{base_spec} {variant_str}' "
+                                f"has total max weight {total:.1f}% (>100%)")
+                })
 
     # Check finish code composition (code = substrate + finish_applied + seq_id)
     # Note: This validation is optional/informational - finish codes are user-defined
     # and may have custom formatting (e.g., leading zeros in seq_id)
-    cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='finish_codes'"
-    )
-    if cursor.fetchone():
+    if "finish_codes" in existing_tables and _has_rows(conn, "finish_codes"):
         cursor.execute("""
             SELECT fc.id, fc.code, s.code, fa.code, fc.seq_id
             FROM finish_codes fc
             JOIN substrates s ON fc.substrate_id = s.id
             JOIN finish_applied fa ON fc.finish_applied_id = fa.id
         """)
-        for row in cursor.fetchall():
-            fc_id, fc_code, sub_code, fa_code, seq_id = row
+        for fc_id, fc_code, sub_code, fa_code, seq_id in cursor:
             # Format seq_id with leading zeros to match common pattern (2 digits)
             seq_id_str = str(seq_id).zfill(2)
             expected_code = f"{sub_code}{fa_code}{seq_id_str}"
@@ -363,9 +569,16 @@ def generate_validation_report(
     all_issues = errors or []
     warnings = warnings or []
 
-    # Separate errors and warnings if mixed in errors list
-    actual_errors = [e for e in all_issues if e.get("severity") == "error"]
-    actual_warnings = [e for e in all_issues if e.get("severity") == "warning"]
+    # Separate errors and warnings if mixed in errors list (one pass; issues
+    # with any other severity are dropped, as before)
+    actual_errors = []
+    actual_warnings = []
+    for issue in all_issues:
+        severity = issue.get("severity")
+        if severity == "error":
+            actual_errors.append(issue)
+        elif severity == "warning":
+            actual_warnings.append(issue)
     actual_warnings.extend(warnings)
 
     error_count = len(actual_errors)
@@ -409,9 +622,22 @@ def validate_all(conn: sqlite3.Connection) -> dict[str, Any]:
     """
     all_issues = []
 
-    # Run all validators
-    all_issues.extend(validate_referential_integrity(conn))
-    all_issues.extend(validate_completeness(conn))
-    all_issues.extend(validate_formats(conn))
+    # One read transaction for every check (unless the caller already has one
+    # open), so the validators share a single snapshot and lock acquisition
+    previous_pragmas = _tune_for_scans(conn)
+    own_transaction = not conn.in_transaction
+    try:
+        if own_transaction:
+            conn.execute("BEGIN")
+        existing_tables = _existing_tables(conn)
+
+        # Run all validators
+        all_issues.extend(validate_referential_integrity(conn, existing_tables))
+        all_issues.extend(validate_completeness(conn, existing_tables))
+        all_issues.extend(validate_formats(conn, existing_tables))
+    finally:
+        if own_transaction and conn.in_transaction:
+            conn.execute("COMMIT")
+        _restore_pragmas(conn, previous_pragmas)
 
     return generate_validation_report(all_issues)
@@ -4,28 +4,81 @@ Enrich specifications in sft_steps.csv with Type/Class/Grade information.
 
 Reads spec_types.csv and updates sft_steps.csv to replace bare specifications
 like "AMS2460" with full versions like "AMS2460 Class 2".
+
+The parsed mapping is pickled to spec_map.pkl under the cache directory
+(HAZARD_CACHE_DIR, default ~/.cache/hazardous_finishes) and reused while
+spec_types.csv keeps the same path, size and mtime.
 """
 
 import csv
+import os
+import pickle
 import sys
 from pathlib import Path
 
+import pandas as pd
+
+
+def _spec_map_cache_file() -> Path:
+    """Return the pickled spec map cache file (under HAZARD_CACHE_DIR when set)."""
+    override = os.environ.get("HAZARD_CACHE_DIR")
+    cache_dir = Path(override) if override else Path.home() / ".cache" / "hazardous_finishes"
+    return cache_dir / "spec_map.pkl"
+
 
 def load_spec_types(spec_types_path: str) -> dict[str, str]:
     """
-    Load specification types mapping.
+    Load specification types mapping, from the pickle cache when the CSV is unchanged.
 
     Returns:
         Dictionary mapping base spec -> full spec with type/class/grade
         Only includes specs where type is not "-"
     """
+    st = os.stat(spec_types_path)
+    key = (str(Path(spec_types_path).resolve()), st.st_mtime_ns, st.st_size)
+    cache_file = _spec_map_cache_file()
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if isinstance(cached, dict) and cached.get('key') == key:
+            return cached['spec_map']
+    except Exception:
+        pass  # Missing, truncated or stale pickle (any unpickling error): reparse
+
+    spec_map = _parse_spec_types(spec_types_path)
+
+    # Cache is best-effort: an unwritable cache dir must never fail the script
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': key, 'spec_map': spec_map}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+    return spec_map
+
+
+def _parse_spec_types(spec_types_path: str) -> dict[str, str]:
+    """Parse spec_types.csv into the load_spec_types() mapping."""
     spec_map = {}
 
     with open(spec_types_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+        # Plain rows (no per-row dict); the two columns are located once
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return spec_map
+        spec_col = header.index('specification')
+        type_col = header.index('Type / Class / Grade')
+
         for row in reader:
-            spec = row['specification'].strip()
-            type_class_grade = row['Type / Class / Grade'].strip()
+            if not row:
+                continue  # Blank line (DictReader skipped these too)
+            spec = row[spec_col].strip()
+            type_class_grade = row[type_col].strip()
 
             if type_class_grade and type_class_grade != '-':
                 # Create full specification name
@@ -53,19 +106,37 @@ def enrich_specs_in_field(associated_specs: str, spec_map: dict[str, str]) -> st
     if not associated_specs or not associated_specs.strip():
         return associated_specs
 
-    # Split by comma
+    # Single spec (the common case): no split/join needed
+    if ',' not in associated_specs:
+        spec = associated_specs.strip()
+        return spec_map.get(spec, spec)
+
+    # Split by comma, replacing each spec with enriched version if available
+    # (keep original if not in mapping)
     specs = [s.strip() for s in associated_specs.split(',')]
+    return ','.join([spec_map.get(spec, spec) for spec in specs])
 
-    # Replace each spec with enriched version if available
-    enriched_specs = []
-    for spec in specs:
-        if spec in spec_map:
-            enriched_specs.append(spec_map[spec])
-        else:
-            # Keep original if not in mapping
-            enriched_specs.append(spec)
 
-    return ','.join(enriched_specs)
+def enrich_specs_column(associated_specs: pd.Series, spec_map: dict[str, str]) -> pd.Series:
+    """
+    Vectorized enrich_specs_in_field() over a column of comma-separated specs.
+
+    Args:
+        associated_specs: Column of comma-separated spec codes (text, no NaN)
+        spec_map: Mapping of base spec -> full spec
+
+    Returns:
+        Column with each non-blank value enriched; blank values are unchanged
+    """
+    has_specs = associated_specs.str.strip() != ''
+    specs = associated_specs[has_specs].str.split(',').explode().str.strip()
+
+    # Keep original if not in mapping
+    enriched = specs.map(spec_map).fillna(specs)
+
+    result = associated_specs.copy()
+    result[has_specs] = enriched.groupby(level=0).agg(','.join)
+    return result
 
 
 def main():
@@ -104,35 +175,31 @@ def main():
     else:
         print(f"\nBackup already exists: {backup_path}")
 
-    # Read sft_steps.csv
+    # Read sft_steps.csv (all text, cells such as "NA" kept verbatim)
     print(f"\nReading {sft_steps_path}...")
-    with open(sft_steps_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
+    df = pd.read_csv(sft_steps_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
 
-    print(f"Found {len(rows)} SFT steps")
+    print(f"Found {len(df)} SFT steps")
 
-    # Update associated_specs in each row
+    # Update associated_specs in one pass over the column
     enriched_count = 0
-    for row in rows:
-        if 'associated_specs' in row and row['associated_specs']:
-            original = row['associated_specs']
-            enriched = enrich_specs_in_field(original, spec_map)
-
-            if original != enriched:
-                row['associated_specs'] = enriched
-                enriched_count += 1
-                print(f"  {row['sft_code']}: {original} → {enriched}")
+    if 'associated_specs' in df.columns:
+        original = df['associated_specs']
+        enriched = enrich_specs_column(original, spec_map)
+
+        changed = original != enriched
+        enriched_count = int(changed.sum())
+        for sft_code, before, after in zip(
+            df.loc[changed, 'sft_code'], original[changed], enriched[changed]
+        ):
+            print(f"  {sft_code}: {before} → {after}")
+        df['associated_specs'] = enriched
 
     print(f"\nEnriched {enriched_count} SFT steps")
 
-    # Write updated file
+    # Write updated file (csv module dialect, as before: CRLF, minimal quoting)
     print(f"\nWriting updated {sft_steps_path}...")
-    with open(sft_steps_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    df.to_csv(sft_steps_path, index=False, encoding='utf-8', lineterminator='\r\n')
 
     print(f"\n✓ Successfully enriched specifications in {sft_steps_path}")
     print(f"✓ Original backed up to: {backup_path}")
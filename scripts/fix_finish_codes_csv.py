@@ -3,6 +3,7 @@
 Fix malformed rows in finish_codes.csv by manually patching known problematic lines.
 """
 
+import codecs
 import sys
 from pathlib import Path
 
@@ -15,15 +16,18 @@ def main():
         print(f"Error: {input_file} not found")
         sys.exit(1)
 
-    # Backup original (if not already backed up)
+    # Read the file once; the backup and the fixes both work from this copy
+    data = input_file.read_bytes()
+
+    # Backup original (if not already backed up), byte for byte
     if not backup_file.exists():
         print(f"Creating backup: {backup_file}")
-        backup_file.write_text(input_file.read_text(encoding='utf-8-sig'))
+        backup_file.write_bytes(data)
     else:
         print(f"Backup already exists: {backup_file}")
 
-    # Read lines
-    lines = input_file.read_text(encoding='utf-8-sig').splitlines()
+    # Split lines
+    lines = data.removeprefix(codecs.BOM_UTF8).decode('utf-8').splitlines()
     fixed_count = 0
 
     # Fix known problematic lines
@@ -44,14 +48,14 @@ def main():
             fixed_count += 1
 
     # Check for other lines that might have issues (lines with unmatched quotes)
+    # Quick heuristic: count quotes (str.count, in C), should be even
     for i, line in enumerate(lines[1:], start=2):  # Skip header
-        # Quick heuristic: count quotes, should be even
         if line.count('"') % 2 != 0:
             print(f"Warning: Line {i} has unmatched quotes: {line[:80]}...")
 
     # Write fixed file
     output = '\n'.join(lines) + '\n'
-    input_file.write_text(output, encoding='utf-8')
+    input_file.write_bytes(output.encode('utf-8'))
 
     print(f"\nFixed {fixed_count} known problematic lines")
     print(f"Fixed file written to: {input_file}")
@@ -51,6 +51,37 @@ else
     exit 1
 fi
 
+# Test 5: Same fixture load with and without the pyarrow CSV parser
+echo "Test 5: Checking fixture ingest under both CSV engines..."
+python - <<'PY'
+import os
+import sqlite3
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+
+from etl.load_csvs import ingest_all
+
+engines = ["c"] + (["pyarrow"] if find_spec("pyarrow") else [])
+for engine in engines:
+    os.environ["HAZARD_CSV_ENGINE"] = engine
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "engine.sqlite")
+        report = ingest_all("tests/fixtures", db_path, "db/schema.sql")
+        conn = sqlite3.connect(db_path)
+        links = conn.execute("SELECT COUNT(*) FROM sft_material_links").fetchone()[0]
+        conn.close()
+    assert report["status"] == "success", f"{engine}: ingest status {report['status']}"
+    assert links == 3, f"{engine}: expected 3 sft_material_links rows, got {links}"
+    print(f"  {engine}: {links} sft_material_links rows")
+PY
+if [ $? -eq 0 ]; then
+    echo "✓ CSV engines agree"
+else
+    echo "✗ CSV engine check failed"
+    exit 1
+fi
+
 # Cleanup
 rm -f test.sqlite test_output.json
 
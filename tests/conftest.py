@@ -0,0 +1,46 @@
+"""
+Shared pytest fixtures: ingest copies of tests/fixtures into temporary databases.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from etl.load_csvs import ingest_all
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+SCHEMA_PATH = REPO_ROOT / "db" / "schema.sql"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the query and digest caches out of the user's ~/.cache."""
+    monkeypatch.setenv("HAZARD_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    """A writable copy of tests/fixtures, for tests that edit the CSVs."""
+    path = tmp_path / "inputs"
+    shutil.copytree(FIXTURES_DIR, path)
+    return path
+
+
+@pytest.fixture
+def ingest(tmp_path):
+    """Ingest a CSV directory into a fresh database; returns (db_path, report)."""
+    def _ingest(source_dir=FIXTURES_DIR):
+        db_path = str(tmp_path / "test.sqlite")
+        report = ingest_all(str(source_dir), db_path, str(SCHEMA_PATH))
+        return db_path, report
+    return _ingest
+
+
+@pytest.fixture
+def fixture_db(ingest):
+    """Path to a database ingested from the unmodified fixtures."""
+    db_path, report = ingest()
+    assert report["status"] == "success", report["errors"]
+    return db_path
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Minimal Typer test to isolate the issue.
+
+Manual, dev-only script: run it directly with
+`python tests/manual/test_typer.py --name you --count 2`. Typer is only
+imported when it runs, so pytest collects this module cheaply and finds
+no tests in it.
+"""
+
+
+def _main():
+    import typer
+
+    app = typer.Typer()
+
+    @app.command()
+    def test(
+        name: str = typer.Option("world"),
+        count: int = typer.Option(1)
+    ):
+        """Test command."""
+        for _ in range(count):
+            print(f"Hello {name}!")
+
+    app()
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,111 @@
+"""
+Tests for CSV ingestion (etl.load_csvs).
+"""
+
+import sqlite3
+
+import pytest
+
+import etl.load_csvs as load_csvs
+
+
+def _steps(db_path, finish_code):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("""
+            SELECT sft.sft_code, fcs.step_order
+            FROM finish_code_steps fcs
+            JOIN finish_codes fc ON fc.id = fcs.finish_code_id
+            JOIN sft_steps sft ON sft.id = fcs.sft_id
+            WHERE fc.code = ?
+            ORDER BY fcs.step_order
+        """, (finish_code,)).fetchall()
+    finally:
+        conn.close()
+
+
+def test_embedded_sft_steps_link_to_sft_defined_later(input_dir, ingest):
+    # finish_codes.csv loads before sft_steps.csv, and SFT-SEAL is only
+    # defined on the last sft_steps.csv row
+    with open(input_dir / "sft_steps.csv", "a") as f:
+        f.write("SFT-SEAL,Coating,Seal anodized parts per TEST-SPEC-003.,"
+                "TEST-SPEC-003,TEST-SOP-004,2024-04-01,Test fixture for MVP\n")
+    (input_dir / "finish_codes.csv").write_text(
+        "finish_code,description,substrate_code,finish_applied_code,seq_id,notes,sft_steps\n"
+        "BP27,Brass passivate test finish,B,P,27,Test fixture for MVP,\n"
+        "SA12,Steel anodize test finish,S,A,12,Test fixture for MVP,\n"
+        'SA13,Steel anodize and seal,S,A,13,Embedded steps only,"[SFT-ANODIZE, SFT-SEAL]"\n'
+    )
+
+    db_path, report = ingest(input_dir)
+
+    assert report["status"] == "success", report["errors"]
+    assert _steps(db_path, "SA13") == [("SFT-ANODIZE", 1), ("SFT-SEAL", 2)]
+    # finish_code_steps.csv rows are unaffected
+    assert _steps(db_path, "BP27") == [("SFT-DEGREASE", 1), ("SFT-PASSIVATE", 2)]
+
+
+def test_sft_specs_rebuilt_from_associated_specs(fixture_db):
+    conn = sqlite3.connect(fixture_db)
+    try:
+        rows = conn.execute("""
+            SELECT sft.sft_code, ss.position, ss.spec
+            FROM sft_specs ss
+            JOIN sft_steps sft ON sft.id = ss.sft_id
+            ORDER BY sft.sft_code, ss.position
+        """).fetchall()
+    finally:
+        conn.close()
+
+    assert rows == [
+        ("SFT-ANODIZE", 0, "TEST-SPEC-002"),
+        ("SFT-DEGREASE", 0, "TEST-SPEC-001"),
+        ("SFT-PASSIVATE", 0, "TEST-SPEC-003"),
+    ]
+
+
+def test_failed_embedded_links_do_not_make_a_partial_load_failed(monkeypatch, ingest):
+    # Every file but finish_codes.csv fails, and so does linking its embedded
+    # steps: nine errors for nine files, yet one file did load
+    def fail(*args, **kwargs):
+        raise ValueError("simulated failure")
+
+    def load_finish_codes(csv_path, conn, sft_steps_data):
+        sft_steps_data.append(("BP27", "[SFT-DEGREASE]"))
+        return 1
+
+    for name in ("load_substrates", "load_finish_applied", "load_sft_steps",
+                 "load_finish_code_steps", "load_materials", "load_chemicals",
+                 "load_sft_material_links", "load_material_chemicals",
+                 "load_finish_code_sft_step_links"):
+        monkeypatch.setattr(load_csvs, name, fail)
+    monkeypatch.setattr(load_csvs, "load_finish_codes", load_finish_codes)
+
+    _, report = ingest()
+
+    assert len(report["errors"]) == 9
+    assert list(report["loaded_files"]) == ["finish_codes.csv"]
+    assert report["status"] == "partial"
+
+
+@pytest.mark.parametrize("engine", load_csvs.CSV_ENGINES)
+def test_csv_engines_load_the_same_links(engine, monkeypatch, ingest):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setenv("HAZARD_CSV_ENGINE", engine)
+
+    db_path, report = ingest()
+
+    assert report["status"] == "success", report["errors"]
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM sft_material_links").fetchone()[0] == 3
+    finally:
+        conn.close()
+
+
+def test_unknown_csv_engine_is_rejected(monkeypatch, ingest):
+    monkeypatch.setenv("HAZARD_CSV_ENGINE", "python")
+
+    with pytest.raises(ValueError, match="HAZARD_CSV_ENGINE"):
+        ingest()
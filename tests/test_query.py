@@ -0,0 +1,71 @@
+"""
+Tests for the query engine and the CLI commands built on it.
+"""
+
+import json
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+from app.cli import cli
+from app.services.query import get_finish_code_specs, iter_all_specifications
+
+
+@pytest.fixture
+def extra_spec_db(fixture_db):
+    """
+    fixture_db with one more spec for SFT-DEGREASE, added to sft_specs only.
+
+    sft_steps.associated_specs is left alone, so the extra spec is only
+    visible to queries that read the sft_specs bridge table.
+    """
+    conn = sqlite3.connect(fixture_db)
+    conn.execute("""
+        INSERT INTO sft_specs (sft_id, position, spec)
+        SELECT id, 1, 'TEST-SPEC-EXTRA' FROM sft_steps WHERE sft_code = 'SFT-DEGREASE'
+    """)
+    conn.commit()
+    conn.close()
+    return fixture_db
+
+
+def test_list_specs_reads_sft_specs(extra_spec_db):
+    result = CliRunner().invoke(cli, ["list-specs", "--db", extra_spec_db, "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    specs = {item["spec"]: item for item in json.loads(result.output)["specifications"]}
+    assert sorted(specs) == ["TEST-SPEC-001", "TEST-SPEC-002", "TEST-SPEC-003", "TEST-SPEC-EXTRA"]
+    assert specs["TEST-SPEC-EXTRA"] == {
+        "spec": "TEST-SPEC-EXTRA",
+        "sft_codes": ["SFT-DEGREASE"],
+        "finish_codes": ["BP27"],
+        "usage_count": 1,
+    }
+
+
+def test_specs_reads_sft_specs(extra_spec_db, tmp_path):
+    output = tmp_path / "specs.json"
+    result = CliRunner().invoke(
+        cli, ["specs", "BP27", "--db", extra_spec_db, "--output", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    specs = json.loads(output.read_text())
+    assert specs["specifications"] == ["TEST-SPEC-001", "TEST-SPEC-003", "TEST-SPEC-EXTRA"]
+    steps = specs["steps_with_specs"]
+    assert [step["sft_code"] for step in steps] == ["SFT-DEGREASE", "SFT-PASSIVATE"]
+    assert steps[0]["associated_specs_list"] == ["TEST-SPEC-001", "TEST-SPEC-EXTRA"]
+
+
+def test_missing_sft_specs_table_asks_for_reingest(fixture_db):
+    # A database ingested before schema 1.1.0 has no sft_specs table
+    conn = sqlite3.connect(fixture_db)
+    conn.execute("DROP TABLE sft_specs")
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(sqlite3.OperationalError, match="re-run"):
+        list(iter_all_specifications(fixture_db))
+    with pytest.raises(sqlite3.OperationalError, match="re-run"):
+        get_finish_code_specs("BP27", fixture_db)
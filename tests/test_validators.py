@@ -0,0 +1,48 @@
+"""
+Tests for post-ingest validation (etl.validators).
+"""
+
+import sqlite3
+
+from etl.validators import _fk_violation_counts, validate_all, validate_referential_integrity
+
+
+def test_clean_fixtures_have_no_orphans(fixture_db):
+    conn = sqlite3.connect(fixture_db)
+    try:
+        assert _fk_violation_counts(conn, "finish_code_steps") == {
+            ("finish_code_id", "finish_codes", "id"): 0,
+            ("sft_id", "sft_steps", "id"): 0,
+        }
+        assert validate_referential_integrity(conn) == []
+    finally:
+        conn.close()
+
+
+def test_foreign_key_check_screen_reports_orphan(fixture_db):
+    conn = sqlite3.connect(fixture_db)
+    try:
+        # foreign_keys is off on a fresh connection, so the orphan goes in
+        conn.execute("""
+            INSERT INTO finish_code_steps (finish_code_id, sft_id, step_order)
+            SELECT id, 9999, 3 FROM finish_codes WHERE code = 'BP27'
+        """)
+        conn.commit()
+
+        screen = _fk_violation_counts(conn, "finish_code_steps")
+        issues = validate_referential_integrity(conn)
+        report = validate_all(conn)
+    finally:
+        conn.close()
+
+    assert [(i["table"], i["column"], i["issue"]) for i in issues] == [
+        ("finish_code_steps", "sft_id", "orphan_fk")
+    ]
+    # The PRAGMA foreign_key_check screen flags only the broken FK, so only
+    # that one gets an orphan probe
+    assert screen == {
+        ("finish_code_id", "finish_codes", "id"): 0,
+        ("sft_id", "sft_steps", "id"): 1,
+    }
+    assert issues[0]["details"].startswith("1 rows reference non-existent sft_steps.id")
+    assert report["status"] == "errors"